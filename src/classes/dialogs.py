@@ -2,7 +2,7 @@
 """dialog_forms.py"""
 from PySide6.QtWidgets import (
     QDialog, QDialogButtonBox, QLabel, QLineEdit, QMessageBox, QPushButton,
-    QTextEdit, QVBoxLayout
+    QSpinBox, QTextEdit, QVBoxLayout
 )
 
 
@@ -61,27 +61,31 @@ class Form(QDialog):
 
 
 class TwoInputs(QDialog):
-    """Allows the user to input two differents values in the same dialog"""
+    """Allows the user to input two differents integers in the same dialog"""
 
     def __init__(
             self, parent=None, title="",
-            label_1="label 1", value_1="0",
-            label_2="label 2", value_2="0"):
+            label_1="label 1", value_1=0, range_1=(-9999, 9999),
+            label_2="label 2", value_2=0, range_2=(-9999, 9999)):
         """Initialize the dialog"""
         super().__init__()
         self.setWindowTitle(title)
         self.layout = QVBoxLayout()
 
-        # First text box
+        # Spin boxes only accept integers within their range
         self.label_1 = QLabel(label_1)
-        self.textbox_1 = QLineEdit(value_1)
+        self.spinbox_1 = QSpinBox()
+        self.spinbox_1.setRange(*range_1)
+        self.spinbox_1.setValue(value_1)
         self.label_2 = QLabel(label_2)
-        self.textbox_2 = QLineEdit(value_2)
+        self.spinbox_2 = QSpinBox()
+        self.spinbox_2.setRange(*range_2)
+        self.spinbox_2.setValue(value_2)
         self.ok_button = QPushButton("OK")
         self.ok_button.clicked.connect(self.accept)
 
-        self.widgets = [self.label_1, self.textbox_1,
-                        self.label_2, self.textbox_2, self.ok_button]
+        self.widgets = [self.label_1, self.spinbox_1,
+                        self.label_2, self.spinbox_2, self.ok_button]
 
         for widget in self.widgets:
             self.layout.addWidget(widget)
@@ -21,7 +21,7 @@ class GraphicsView(QGraphicsView):
         super().__init__(parent)
 
         # Initialize attributes
-        self.unique_index = []
+        self.unique_index = set()
         self.mass_highlight = []
         self.highlight_selected = (None, None)
         self.app = self.parent().parent()
@@ -174,7 +174,7 @@ class GraphicsView(QGraphicsView):
 
         if self.drag_item and self.drag_indexes[0]:
             if self.app.animation and self.app.animation[0] is not None:
-                image_manipulation.stop_animations[self.app]
+                image_manipulation.stop_animation(self.app)
 
             if not self.drag_highlight:
                 return
@@ -402,8 +402,9 @@ class GraphicsView(QGraphicsView):
         cell_origin = maths.cell_origin(cell_index)
 
         # Check if the click is out of bounds
-        limit = maths.cell_origin((maths.grid_col() - 1, maths.grid_row() - 1))
-        if any(coord < 0 or coord > limit for coord, limit, in zip(cell_origin, limit)):
+        limit_x, limit_y = maths.grid_limit()
+        if not (0 <= cell_origin[0] <= limit_x
+                and 0 <= cell_origin[1] <= limit_y):
             return
 
         if event.mimeData().hasUrls():
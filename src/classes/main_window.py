@@ -4,9 +4,10 @@ import os
 import sys
 import textwrap
 import markdown
+from collections import OrderedDict
 from functools import partial
 from dotenv import load_dotenv
-from PySide6.QtCore import QRectF, QSize, Qt, QEvent
+from PySide6.QtCore import QRectF, QSize, Qt, QEvent, QTimer
 from PySide6.QtGui import QAction, QActionGroup, QIcon, QPixmap, QTransform, QCursor
 from PySide6.QtWidgets import (
     QGraphicsScene, QLabel, QMainWindow, QProgressBar, QPushButton,
@@ -78,6 +79,10 @@ class MainWindow(QMainWindow):
         self.group_size = QActionGroup(self)
         self.group_tile = QActionGroup(self)
 
+        # Checkable actions by config key then by value, to restore the
+        # checked action when a config change is cancelled
+        self.config_actions = {}
+
         # Create dicts to have easy references to our widgets across modules
         self.buttons = {}
         self.sliders = {}
@@ -89,11 +94,18 @@ class MainWindow(QMainWindow):
         self.thread_running = False
 
         self.modified_images = []
-        self.copied_images = []
+        self.copied_image = None
         self.animation = [None, None]
+        self.animation_timer = QTimer(self)
+        self.animation_timer.setInterval(140)
+        self.animation_frames = None
         self.undo = []
         self.redo = []
         self.temp = []
+        self.temp_cache = OrderedDict()
+
+        # Scaled pixmaps shown in the zoom view, by pixmap cache key and size
+        self.zoom_cache = {}
 
         self.weapons = {}
         self.images = {}
@@ -218,6 +230,16 @@ class MainWindow(QMainWindow):
                         group.addAction(action)
                         submenu.addAction(action)
 
+                        if group == self.group_size:
+                            config_key = "CELL SIZE"
+                        elif group == self.group_tile:
+                            config_key = "TILESET SHEET"
+                        elif group == self.group_preset:
+                            config_key = "TYPE"
+
+                        self.config_actions.setdefault(
+                            config_key, {})[action.text()] = action
+
                         if (config.config_get("TYPE") == "Holder SV Actors"
                             and action.text() in [
                                 "16x16", "24x24", "32x32", "48x48",
@@ -234,13 +256,6 @@ class MainWindow(QMainWindow):
                         if "(WIP)" in action.text():
                             action.setEnabled(False)
 
-                        if group == self.group_size:
-                            config_key = "CELL SIZE"
-                        elif group == self.group_tile:
-                            config_key = "TILESET SHEET"
-                        elif group == self.group_preset:
-                            config_key = "TYPE"
-
                         if action.text() == config.config_get(config_key):
                             action.setChecked(True)
 
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 """slider_hsv.py"""
 from PySide6.QtCore import QEventLoop, Qt, QThread, Signal
-from PySide6.QtGui import QColor, QImage, QPixmap
+from PySide6.QtGui import QImage, QPixmap
 from PySide6.QtWidgets import QGraphicsPixmapItem, QSlider
 from modules import grid_manager
 from modules import image_manipulation
@@ -332,48 +332,9 @@ class HsvProcessor(QThread):
         if not image:
             return
 
-        # Convert the pixmap to a QImage
-        image = image.pixmap().toImage()
-
-        # Create a new QImage with the same size and format as the original image
-        modified_image = QImage(image.size(), QImage.Format_ARGB32)
-
-        for x in range(image.width()):
-            for y in range(image.height()):
-                pixel = image.pixel(x, y)
-                if pixel < 1:
-                    modified_image.setPixelColor(
-                        x, y, Qt.GlobalColor.transparent)
-                    continue
-                # Extract the alpha value from the pixel
-                alpha = (pixel >> 24) & 0xFF
-                pixel_color = QColor(pixel)
-
-                component_map = {
-                    "hue": lambda: pixel_color.setHsv(
-                        self.value,
-                        pixel_color.saturation(),
-                        pixel_color.value(),
-                        alpha
-                    ),
-                    "saturation": lambda: pixel_color.setHsv(
-                        pixel_color.hue(),
-                        self.value,
-                        pixel_color.value(),
-                        alpha
-                    ),
-                    "value": lambda: pixel_color.setHsv(
-                        pixel_color.hue(),
-                        pixel_color.saturation(),
-                        max(0, min(pixel_color.value() + self.value, 255)),
-                        alpha
-                    )
-                }
-
-                component_map[self.component]()
-                modified_pixel = QColor(
-                    pixel_color.red(), pixel_color.green(), pixel_color.blue(), alpha)
-                modified_image.setPixelColor(x, y, modified_pixel)
+        # Change the hsv component of every pixels at once
+        modified_image = image_manipulation.adjust_hsv(
+            image.pixmap().toImage(), self.component, self.value)
 
         self.image_processed.emit(
             self.app, self.value, self.component, modified_image)
@@ -9,7 +9,8 @@ from PySide6.QtCore import QPoint, Qt, QThread, Signal
 from PySide6.QtGui import QImage, QPainter, QPixmap
 from PySide6.QtWidgets import (
     QFileDialog, QGraphicsPixmapItem, QHeaderView, QTreeWidgetItem, QTreeWidget,
-    QVBoxLayout, QDialog, QCheckBox, QGridLayout, QPushButton, QComboBox, QLabel)
+    QVBoxLayout, QDialog, QCheckBox, QGridLayout, QPushButton, QComboBox, QLabel,
+    QMessageBox)
 from PIL import Image
 from classes.frame import FloatingFrame
 from modules import files
@@ -198,11 +199,16 @@ def add_weapon_layer(app, file_path, layer):
 
     app.weapons.clear()
 
-    for column in range(maths.grid_col()):
-        for row in range(max(min(
-                image.height() // cell_height + 1, maths.grid_row()), 1)):
+    # Retrieve the grid dimensions once for the whole loop
+    grid_col = maths.grid_col()
+    grid_row = maths.grid_row()
+    rows = max(min(image.height() // cell_height + 1, grid_row), 1)
+    limit_x, limit_y = maths.grid_limit()
+
+    for column in range(grid_col):
+        for row in range(rows):
             # Calculate the origin of the cell
-            cell_origin = maths.cell_origin((column, row))
+            cell_origin = (column * cell_width, row * cell_height)
 
             # Crop the image to the cell size
             crop_image = image.copy(*cell_origin, cell_width, cell_height)
@@ -222,15 +228,10 @@ def add_weapon_layer(app, file_path, layer):
             if not utils.has_valid_pixel(crop_image):
                 continue
 
-            # Calculate the grid cell origin
-            cell_index = (column, row)
-            cell_origin = maths.cell_origin(cell_index)
-
             # Check if the cell is out of bounds
-            limit = maths.cell_origin(
-                (maths.grid_col() - 1, maths.grid_row() - 1))
-            if any(coord < 0 or coord > limit
-                    for coord, limit, in zip(cell_origin, limit)):
+            cell_index = (column, row)
+            if not (0 <= cell_origin[0] <= limit_x
+                    and 0 <= cell_origin[1] <= limit_y):
                 continue
 
             # Create a pixmap
@@ -291,7 +292,6 @@ def save_chara_with_weapon(app):
         pixmap.fill(Qt.GlobalColor.transparent)
 
         painter = QPainter(pixmap)
-        painter.drawPixmap(0, 0, pixmap)
 
         # Display the progress bar
         app.progress_bar.move(
@@ -601,7 +601,7 @@ def tree_view(app):
         <br>
         <br>Do you want to continue ?                         
         """), "WARNING", ["OK", "CANCEL"], "Slow Process Warning")
-    if response != "OK":
+    if response != QMessageBox.StandardButton.Ok:
         return
 
     weapon_folder = files.prompt_folder(app)
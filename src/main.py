@@ -26,6 +26,7 @@ from dotenv import load_dotenv
 from PySide6.QtWidgets import QApplication, QStyleFactory
 from classes.main_window import MainWindow
 from modules import config
+from modules import files
 from modules import misc
 from modules import utils
 
@@ -76,6 +77,11 @@ def main():
 
 def restart():
     """Restart the program."""
+    # Finish writing the queued files first, os.execv replaces the process
+    # before aboutToQuit is ever emitted
+    files.wait_temp_writes()
+    files.wait_saves()
+
     # Quit the current application
     QApplication.quit()
 
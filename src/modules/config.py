@@ -4,6 +4,9 @@ import configparser
 import datetime
 import os
 
+# Parsed content of the config file, read once and kept in sync by config_set
+snapshot = None
+
 
 def ensure_config() -> str:
     """
@@ -73,6 +76,25 @@ def create_config(config_file: str) -> str:
     return config_file
 
 
+def config_snapshot() -> configparser.ConfigParser:
+    """
+    Retrieve the parsed config file, reading it on the first call only.
+
+    Returns:
+        - configparser.ConfigParser: The content of the config file.
+    """
+    global snapshot
+
+    if snapshot is None:
+        # Create a new configparser object
+        snapshot = configparser.ConfigParser()
+
+        # Read the config file
+        snapshot.read(ensure_config())
+
+    return snapshot
+
+
 def config_get(key: str) -> str:
     """
     Retrieve a configuration value based on a provided key.
@@ -83,17 +105,8 @@ def config_get(key: str) -> str:
     Returns:
         - str: The configuration value associated to the provided key.
     """
-    # Get the path to the config file
-    config_file = ensure_config()
-
-    # Create a new configparser object
-    config = configparser.ConfigParser()
-
-    # Read the config file
-    config.read(config_file)
-
     # Retrieve the config value based on the provided key
-    value = config.get("GENERAL", key)
+    value = config_snapshot().get("GENERAL", key)
 
     return value
 
@@ -110,13 +123,9 @@ def config_set(key: str, value: str) -> None:
     # Get the path to the config file
     config_file = ensure_config()
 
-    # Create a new configparser object
-    config = configparser.ConfigParser()
-
-    # Read the config file
-    config.read(config_file)
-
-    # Set the configuration value in the "GENERAL" section
+    # Set the configuration value in the "GENERAL" section, the snapshot
+    # is updated along with the file so it never needs to be read again
+    config = config_snapshot()
     config.set("GENERAL", key, value)
 
     # Write the updated configuration to the config file
@@ -1,15 +1,32 @@
 #!/usr/bin/env python
 """files.py"""
+import html
 import os
 import tempfile
-from PySide6.QtCore import QDir, QPoint, Qt
+from PySide6.QtCore import (
+    QDir, QObject, QPoint, QRunnable, QThreadPool, Qt, Signal)
 from PySide6.QtGui import QImage, QPainter, QPixmap
 from PySide6.QtWidgets import QFileDialog, QGraphicsPixmapItem, QInputDialog
 from modules import config
 from modules import grid_manager
+from modules import image_manipulation
 from modules import maths
 from modules import utils
 
+# Number of temporary images kept in memory for undo and redo
+TEMP_CACHE_SIZE = 256
+
+# PNG quality of temporary files, Qt maps it to the zlib level 1 which
+# encodes a few times faster than the default level for slightly larger files
+TEMP_PNG_QUALITY = 89
+
+# Thread pool encoding the files saved by the user, kept apart from the
+# global pool so that waiting for the temporary files never waits for them
+save_pool = QThreadPool()
+
+# Signals of the saves being written, kept alive until every file is done
+pending_saves = set()
+
 
 def create_temp(app, image):
     """
@@ -24,64 +41,224 @@ def create_temp(app, image):
     if not image:
         return None
 
-    # Convert QGraphicsPixmapItem to an image
+    # Retrieve the pixmap of a QGraphicsPixmapItem
     if isinstance(image, QGraphicsPixmapItem):
-        image = image.pixmap().toImage()
+        image = image.pixmap()
 
     # Check that we are not creating a temp for an "empty" image
     if not utils.has_valid_pixel(image):
         return None
 
+    if isinstance(image, QPixmap):
+        image = image.toImage()
+
     # Create a temporary file with the .png extension
-    with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as temp:
-        app.temp.append(temp.name)
-        image.save(temp.name)
-        return temp.name
+    path = create_temp_path(app)
+    image.save(path, "PNG", TEMP_PNG_QUALITY)
+    cache_temp(app, path, image)
+    return path
 
 
-def create_temp_all(app):
+def create_temp_all(app, background=False):
     """
     Create a temporary file containing all the images in the grid.
 
     Args:
         - app: The application main window.
+        - background: Write the file from the thread pool instead of
+            blocking the caller until the png is encoded.
 
     Returns:
-        - str: The path of the temporary file.
+        - str: The path of the temporary file, or None if the grid is empty.
     """
     # Retrieve cell size attribute from the app
     cell_width, cell_height = app.cell_size
 
-    # Check that we have item in the grid
-    if app.images is None:
+    # Check that we have item in the grid, an empty grid has nothing to
+    # paint and is restored by clearing the view
+    if not app.images:
         return None
 
     # Calculate the width and height of the current grid state
     width = maths.grid_col() * cell_width
     height = (maths.max_row(app) + 1) * cell_height
 
-    # Create a pixmap with those specifics size
-    pixmap = QPixmap(width, height)
-    pixmap.fill(Qt.GlobalColor.transparent)
+    # Create an image with those specifics size, unlike a pixmap it can be
+    # handed over to another thread once painted
+    image = QImage(width, height, image_manipulation.IMAGE_FORMAT)
+    image.fill(Qt.GlobalColor.transparent)
 
-    painter = QPainter(pixmap)
-    painter.drawPixmap(0, 0, pixmap)
+    painter = QPainter(image)
 
-    # Iterate over every items in the scene and draw them on the pixmap
-    for item in app.main_view.scene.items():
-        if isinstance(item, QGraphicsPixmapItem):
-            pos = item.pos()
-            pixmap_item = item.pixmap()
-            item_pos = QPoint(pos.x(), pos.y())
-            painter.drawPixmap(item_pos, pixmap_item)
+    # Iterate over every items of the grid and draw them on the image
+    for item in grid_manager.grid_items(app):
+        pos = item.pos()
+        painter.drawPixmap(QPoint(pos.x(), pos.y()), item.pixmap())
 
     painter.end()
 
     # Create the temporary file with the .png extension
-    with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as temp:
-        app.temp.append(temp.name)
-        pixmap.save(temp.name)
-        return temp.name
+    path = create_temp_path(app)
+    cache_temp(app, path, image)
+
+    if background:
+        QThreadPool.globalInstance().start(
+            ImageWriter(image, path, TEMP_PNG_QUALITY))
+    else:
+        image.save(path, "PNG", TEMP_PNG_QUALITY)
+
+    return path
+
+
+def create_temp_path(app):
+    """
+    Create an empty temporary png file which is deleted on exit.
+
+    Args:
+        - app: The application main window.
+
+    Returns:
+        - str: The path of the temporary file.
+    """
+    # Close the file right away, the image is saved to it by path and an
+    # open handle would prevent that on Windows
+    handle, path = tempfile.mkstemp(suffix=".png")
+    os.close(handle)
+
+    app.temp.append(path)
+    return path
+
+
+def cache_temp(app, path, image):
+    """
+    Keep the image of a temporary file in memory to avoid decoding it again.
+
+    Args:
+        - app: The application main window.
+        - path: The path of the temporary file.
+        - image: The QImage saved to the temporary file.
+    """
+    app.temp_cache[path] = image
+    app.temp_cache.move_to_end(path)
+
+    # Forget the least recently used images, they can still be read from disk
+    while len(app.temp_cache) > TEMP_CACHE_SIZE:
+        app.temp_cache.popitem(last=False)
+
+
+def load_temp(app, path):
+    """
+    Retrieve the image of a temporary file.
+
+    Args:
+        - app: The application main window.
+        - path: The path of the temporary file.
+
+    Returns:
+        - QImage: The cached image, or the image decoded from the file.
+    """
+    image = app.temp_cache.get(path)
+
+    if image is None:
+        return QImage(path)
+
+    app.temp_cache.move_to_end(path)
+    return image
+
+
+def wait_temp_writes():
+    """Block until every temporary file queued in the thread pool is written."""
+    QThreadPool.globalInstance().waitForDone()
+
+
+def wait_saves():
+    """Block until every file saved by the user is written."""
+    save_pool.waitForDone()
+
+
+def save_images(app, images):
+    """
+    Encode images to png files from the save pool.
+
+    The progress bar follows the written files and is removed once every
+    file is done, the files which could not be written are then reported.
+
+    Args:
+        - app: The application main window.
+        - images: A list of (QImage, path) tuples to save.
+    """
+    if not images:
+        return
+
+    # Display the progress bar
+    timer = utils.show_progress(app)
+
+    total = len(images)
+    written = 0
+    failed = []
+
+    signals = SaveSignals()
+    pending_saves.add(signals)
+
+    def file_written(path, success):
+        nonlocal written
+
+        # Keep track of the written files, this runs on the GUI thread
+        written += 1
+        if not success:
+            failed.append(path)
+
+        utils.update_progress(app, timer, written, total)
+        if written < total:
+            return
+
+        # Remove the progress bar once every file is written
+        pending_saves.discard(signals)
+        utils.hide_progress(app)
+
+        if failed:
+            utils.show_popup(
+                "The following file(s) could not be saved:<br>"
+                + "<br>".join(html.escape(path) for path in failed),
+                "ERROR", ["OK"])
+
+    signals.written.connect(file_written)
+
+    for image, path in images:
+        save_pool.start(ImageWriter(image, path, signals=signals))
+
+
+class SaveSignals(QObject):
+    """Signals sent from the save pool to the GUI thread."""
+    written = Signal(str, bool)
+
+
+class ImageWriter(QRunnable):
+    """Save an already painted image to a file from the thread pool."""
+
+    def __init__(self, image, path, quality=-1, signals=None):
+        """
+        Initialize the runnable
+
+        Args:
+            - image: The QImage to save, pixmaps cannot leave the main thread.
+            - path: The path of the png file.
+            - quality: The png quality, -1 uses the default compression.
+            - signals: The SaveSignals told whether the file was written.
+        """
+        super().__init__()
+        self.image = image
+        self.path = path
+        self.quality = quality
+        self.signals = signals
+
+    def run(self):
+        success = False
+        try:
+            success = self.image.save(self.path, "PNG", self.quality)
+        finally:
+            if self.signals is not None:
+                self.signals.written.emit(self.path, success)
 
 
 def save_highlighted_cell(app):
@@ -120,30 +297,14 @@ def save_highlighted_cell(app):
             else:
                 name_prefix = "image"
 
-            # Display the progress bar
-            app.progress_bar.move(
-                app.width() // 2 - app.progress_bar.width() // 2,
-                app.height() // 2 - app.progress_bar.height() // 2)
-            app.progress_bar.setVisible(True)
-
-            current_value = 0
-            for image, index in images:  # Retrieve both the image and the index
-                # Keep track of the methods progress
-                current_value += 1
-                progress = current_value / len(images) * 100
-                app.progress_bar.setValue(progress)
-
-                # Remove the progress bar if the methods reached the end
-                if progress >= 100:
-                    app.progress_bar.move(app.width(), app.height())
-                    app.progress_bar.setVisible(False)
-                    app.progress_bar.setValue(0)
-
-                # Save the pixmap as a PNG file
-                pixmap = image.pixmap()
-                image_path = os.path.join(
-                    folder_path, f"{name_prefix}_{index[1]}_{index[0]}.png")
-                pixmap.save(image_path)
+            # Join the folder and the prefix once for every file
+            base_path = os.path.join(folder_path, name_prefix) + "_"
+
+            # Encode the PNG files from the save pool
+            save_images(app, [
+                (image.pixmap().toImage(),
+                 f"{base_path}{index[1]}_{index[0]}.png")
+                for image, index in images])
 
     elif app.main_view.highlight_selected[0]:
         # Retrieve the image
@@ -187,39 +348,23 @@ def save_individually_each_cell(app):
         name_prefix = "image"
 
     if folder_path:
-        # Display the progress bar
-        app.progress_bar.move(
-            app.width() // 2 - app.progress_bar.width() // 2,
-            app.height() // 2 - app.progress_bar.height() // 2)
-        app.progress_bar.setVisible(True)
+        # Join the folder and the prefix once for every file
+        base_path = os.path.join(folder_path, name_prefix) + "_"
 
-        current_value = 0
+        images = []
 
         # Loop through all item and save them
         for index in app.images:
-            # Keep track of the methods progress
-            current_value += 1
-            progress = current_value / len(app.images) * 100
-            app.progress_bar.setValue(progress)
-
-            # Remove the progress bar if the methods reached the end
-            if progress >= 100:
-                app.progress_bar.move(app.width(), app.height())
-                app.progress_bar.setVisible(False)
-                app.progress_bar.setValue(0)
-
             # Check if the image contains "valid" pixels
-            if not utils.has_valid_pixel(
-                    grid_manager.get_image_at(app, index).pixmap().toImage()):
+            if not utils.has_valid_pixel(app.images[index].pixmap()):
                 continue
 
-            image_path = os.path.join(
-                folder_path, f"{name_prefix}_{index[1]}_{index[0]}.png")
-            image = app.images[index]
+            images.append((
+                app.images[index].pixmap().toImage(),
+                f"{base_path}{index[1]}_{index[0]}.png"))
 
-            # Save each item as an image file
-            pixmap = image.pixmap()
-            pixmap.save(image_path)
+        # Encode each item as an image file from the save pool
+        save_images(app, images)
 
 
 def save_all_together(app):
@@ -253,40 +398,32 @@ def save_all_together(app):
         pixmap.fill(Qt.GlobalColor.transparent)
 
         painter = QPainter(pixmap)
-        painter.drawPixmap(0, 0, pixmap)
 
         # Display the progress bar
-        app.progress_bar.move(
-            app.width() // 2 - app.progress_bar.width() // 2,
-            app.height() // 2 - app.progress_bar.height() // 2)
-        app.progress_bar.setVisible(True)
+        timer = utils.show_progress(app)
 
         current_value = 0
 
+        # Retrieve the items of the grid in paint order
+        items = grid_manager.grid_items(app)
+        total = len(items)
+
         # Loop through all item and save them
-        for item in app.main_view.scene.items():
+        for item in items:
             # Keep track of the methods progress
             current_value += 1
-            progress = current_value / len(app.main_view.scene.items()) * 100
-            app.progress_bar.setValue(progress)
-
-            # Remove the progress bar if the methods reached the end
-            if progress >= 100:
-                app.progress_bar.move(app.width(), app.height())
-                app.progress_bar.setVisible(False)
-                app.progress_bar.setValue(0)
+            utils.update_progress(app, timer, current_value, total)
 
             # Draw the QGraphicsPixmapItem to the pixmap
-            if isinstance(item, QGraphicsPixmapItem):
-                painter.drawPixmap(
-                    QPoint(int(item.pos().x()), int(item.pos().y())),
-                    item.pixmap()
-                )
+            pos = item.pos()
+            painter.drawPixmap(QPoint(pos.x(), pos.y()), item.pixmap())
 
         painter.end()
 
-        # Save the pixmap as an image file
-        pixmap.save(file_path)
+        # Encode the image file from the save pool to keep the interface
+        # responsive while a large grid is compressed, the progress bar
+        # stays displayed until the file is written
+        save_images(app, [(pixmap.toImage(), file_path)])
 
 
 def prompt_file(app):
@@ -1,9 +1,11 @@
 #!/usr/bin/env python
 """grid_manager.py"""
 import textwrap
+from contextlib import contextmanager
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QImage, QPainter, QPixmap
-from PySide6.QtWidgets import QDialog, QGraphicsPixmapItem
+from PySide6.QtWidgets import (
+    QDialog, QGraphicsPixmapItem, QGraphicsScene, QMessageBox)
 from classes.dialogs import TwoInputs, FourInputs
 from classes.item_highlight import Highlight
 from modules import config
@@ -23,8 +25,11 @@ def click_cell(event, app, modif=None):
         - event: The mouse event triggered by the click.
         - app: The application main window.
     """
-    # Retrieve main_view and cell_size from the app
+    # Retrieve main_view, its scene and cell_size from the app once, every
+    # click goes through this function
     main_view = app.main_view
+    scene = main_view.scene
+    mass_highlight = main_view.mass_highlight
     cell_width, cell_height = app.cell_size
 
     # Map the event position to scene coordinates
@@ -36,67 +41,76 @@ def click_cell(event, app, modif=None):
     cell_origin = maths.cell_origin(cell_index)
 
     # Check if the click is out of grid bounds
-    limit = maths.cell_origin((maths.grid_col() - 1, maths.grid_row() - 1))
-    if any(coord < 0 or coord > limit for coord, limit, in zip(cell_origin, limit)):
+    limit_x, limit_y = maths.grid_limit()
+    if not (0 <= cell_origin[0] <= limit_x
+            and 0 <= cell_origin[1] <= limit_y):
         return
 
+    unique_index = main_view.unique_index
+    highlight_selected = main_view.highlight_selected
+
     if modif == "mass":
-        if main_view.highlight_selected[0]:
-            main_view.mass_highlight.append((
-                main_view.highlight_selected[0], main_view.highlight_selected[1]))
-            main_view.unique_index.append((main_view.highlight_selected[1]))
-            main_view.mass_highlight[-1][0].reset_timer()
+        if highlight_selected[0]:
+            mass_highlight.append((
+                highlight_selected[0], highlight_selected[1]))
+            unique_index.add(highlight_selected[1])
+            highlight_selected[0].reset_timer()
             main_view.highlight_selected = [None, None]
 
         # Check that the cell index is unique to prevent overlapping highlight.
-        if cell_index not in main_view.unique_index:
+        if cell_index not in unique_index:
             # Add the highlight to the list and scene.
-            main_view.mass_highlight.append((
-                Highlight("red", cell_width, cell_height), cell_index))
-            main_view.scene.addItem(main_view.mass_highlight[-1][0])
-            main_view.mass_highlight[-1][0].setZValue(2)
-            main_view.mass_highlight[-1][0].setOpacity(0.5)
-            main_view.mass_highlight[-1][0].setPos(*cell_origin)
+            highlight = Highlight("red", cell_width, cell_height)
+            mass_highlight.append((highlight, cell_index))
+            scene.addItem(highlight)
+            highlight.setZValue(2)
+            highlight.setOpacity(0.5)
+            highlight.setPos(*cell_origin)
 
             # Make sure that every highlights blink at the same time.
-            for highlight, index in main_view.mass_highlight:
+            for highlight, index in mass_highlight:
                 highlight.reset_timer()
 
             # Add the index to a list for comparaison.
-            main_view.unique_index.append((cell_index))
+            unique_index.add(cell_index)
 
     elif modif is None:
         # Check if there is already a highlight.
-        if len(main_view.mass_highlight) > 0:
-            for highlight, index in main_view.mass_highlight:
-                main_view.scene.removeItem(highlight)
+        if len(mass_highlight) > 0:
+            for highlight, index in mass_highlight:
+                scene.removeItem(highlight)
 
-            main_view.mass_highlight.clear()
-            main_view.unique_index.clear()
+            mass_highlight.clear()
+            unique_index.clear()
 
-        if main_view.highlight_selected[0] is None:
-            main_view.highlight_selected = [
+        # Remember the selected cell, the label already shows it
+        previous_index = highlight_selected[1]
+
+        if highlight_selected[0] is None:
+            highlight_selected = main_view.highlight_selected = [
                 Highlight("red", cell_width, cell_height),
                 cell_index
             ]
-            main_view.scene.addItem(main_view.highlight_selected[0])
-            main_view.highlight_selected[0].setZValue(2)
-            main_view.highlight_selected[0].setOpacity(0.5)
+            scene.addItem(highlight_selected[0])
+            highlight_selected[0].setZValue(2)
+            highlight_selected[0].setOpacity(0.5)
 
         # Set the position and index of the highlight item
-        main_view.highlight_selected[1] = cell_index
-        main_view.highlight_selected[0].setPos(*cell_origin)
-        main_view.highlight_selected[0].reset_timer()
+        highlight = highlight_selected[0]
+        highlight_selected[1] = cell_index
+        highlight.setPos(*cell_origin)
+        highlight.reset_timer()
 
         # Check if animations are already being played
         if app.animation and app.animation[1] is not None:
             image_manipulation.stop_animation(app)
 
-        # Update the main window label
-        num = cell_index[1] * 16 + cell_index[0]
-        app.labels["Index"].setText(
-            f"● [{cell_index[0]}:{cell_index[1]}] - Cell n°{num} ●"
-        )
+        # Update the main window label when another cell is selected
+        if previous_index != cell_index:
+            num = cell_index[1] * maths.grid_col() + cell_index[0]
+            app.labels["Index"].setText(
+                f"● [{cell_index[0]}:{cell_index[1]}] - Cell n°{num} ●"
+            )
 
 
 def highlight_index(app, cell_index, modif=None):
@@ -115,15 +129,16 @@ def highlight_index(app, cell_index, modif=None):
     cell_origin = maths.cell_origin(cell_index)
 
     # Check if the click is out of grid bounds
-    limit = maths.cell_origin((maths.grid_col() - 1, maths.grid_row() - 1))
-    if any(coord < 0 or coord > limit for coord, limit, in zip(cell_origin, limit)):
+    limit_x, limit_y = maths.grid_limit()
+    if not (0 <= cell_origin[0] <= limit_x
+            and 0 <= cell_origin[1] <= limit_y):
         return
 
     if modif == "mass":
         if main_view.highlight_selected[0]:
             main_view.mass_highlight.append((
                 main_view.highlight_selected[0], main_view.highlight_selected[1]))
-            main_view.unique_index.append((main_view.highlight_selected[1]))
+            main_view.unique_index.add(main_view.highlight_selected[1])
             main_view.mass_highlight[-1][0].reset_timer()
             main_view.highlight_selected = [None, None]
 
@@ -142,7 +157,7 @@ def highlight_index(app, cell_index, modif=None):
                 highlight.reset_timer()
 
             # Add the index to a list for comparaison.
-            main_view.unique_index.append((cell_index))
+            main_view.unique_index.add(cell_index)
             main_view.mass_highlight = sorted(
                 main_view.mass_highlight, key=lambda x: (x[1][0], x[1][1]))
 
@@ -155,6 +170,9 @@ def highlight_index(app, cell_index, modif=None):
             main_view.mass_highlight.clear()
             main_view.unique_index.clear()
 
+        # Remember the selected cell, the edits highlight it again
+        previous_index = main_view.highlight_selected[1]
+
         if main_view.highlight_selected[0] is None:
             main_view.highlight_selected = [
                 Highlight("red", cell_width, cell_height),
@@ -169,11 +187,12 @@ def highlight_index(app, cell_index, modif=None):
         main_view.highlight_selected[0].reset_timer()
         main_view.highlight_selected[1] = cell_index
 
-        # Update the main window label
-        num = cell_index[1] * 16 + cell_index[0]
-        app.labels["Index"].setText(
-            f"● [{cell_index[0]}:{cell_index[1]}] - Cell n°{num} ●"
-        )
+        # Update the main window label when another cell is selected
+        if previous_index != cell_index:
+            num = cell_index[1] * maths.grid_col() + cell_index[0]
+            app.labels["Index"].setText(
+                f"● [{cell_index[0]}:{cell_index[1]}] - Cell n°{num} ●"
+            )
 
 
 def get_image_at(app, index):
@@ -185,12 +204,25 @@ def get_image_at(app, index):
         - app: The application main window.
         - index: The index of the cell to retrieve the image from.
     """
-    if index in app.images:
-        # Return the QGraphicsPixmapItem at the specified index
-        return app.images[index]
+    # Return the QGraphicsPixmapItem at the specified index or None if the
+    # index is not present
+    return app.images.get(index)
 
-    # Return None if the index is not present
-    return None
+
+def grid_items(app):
+    """
+    Get every QGraphicsPixmapItem of the grid in paint order.
+
+    Args:
+        - app: The application main window.
+
+    Returns:
+        - list: The weapon layers below the cells, the cells, then the
+            weapon layers above the cells.
+    """
+    below = [item for item, layer in app.weapons.values() if layer < 0]
+    above = [item for item, layer in app.weapons.values() if layer >= 0]
+    return below + list(app.images.values()) + above
 
 
 def get_weapon_layer(app, index):
@@ -230,6 +262,9 @@ def add_to_grid(app, image, index, history=True):
     if not utils.has_valid_pixel(image):
         return
 
+    # Convert the image once so scaling and drawing it use the pixmap format
+    image = image.convertToFormat(image_manipulation.IMAGE_FORMAT)
+
     # Remove any existing image at the index
     temp_path = remove_from_grid(app, index)
 
@@ -291,13 +326,12 @@ def remove_from_grid(app, index, history=False):
         return
 
     # Check if there is an image at the cell index
-    if index not in app.images:
+    item = app.images.pop(index, None)
+    if item is None:
         return
 
-    item = app.images[index]
     temp_path = files.create_temp(app, item)
     app.main_view.scene.removeItem(item)
-    del app.images[index]
 
     # Add the action to the actions history
     if history:
@@ -306,6 +340,28 @@ def remove_from_grid(app, index, history=False):
     return temp_path
 
 
+@contextmanager
+def batch_scene_changes(app):
+    """
+    Suspend the main scene index and signals while replacing many items.
+
+    The index is rebuilt once when leaving the context instead of being
+    updated for every added or removed item.
+
+    Args:
+        - app: The application main window.
+    """
+    scene = app.main_view.scene
+    scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
+    scene.blockSignals(True)
+
+    try:
+        yield scene
+    finally:
+        scene.blockSignals(False)
+        scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.BspTreeIndex)
+
+
 def clear_main_view(app):
     """
     Remove every images contained in the main scene.
@@ -343,7 +399,7 @@ def new(app):
             Do you want to continue without saving ?
         """), "WARNING", ["YES", "NO"])
 
-    if response != "&Yes":
+    if response != QMessageBox.StandardButton.Yes:
         return
 
     # Remove every images
@@ -385,28 +441,36 @@ def load(app, image=None, history=True, reset=False, index=None):
         return
 
     if history and app.images:
-        # Create a history entry
-        temp_path = files.create_temp_all(app)
+        # Create a history entry, the png is written while the new image loads
+        temp_path = files.create_temp_all(app, True)
         utils.history(app, "OVERHAUL", None, temp_path)
 
     if reset:
         clear_main_view(app)
 
+    # Convert the image once instead of converting every cropped cell
+    image = image.convertToFormat(image_manipulation.IMAGE_FORMAT)
+
     # Display the progress bar
     max_value = maths.grid_col() * max(min(
         image.height() // cell_height, maths.grid_row()), 1)
     app.progress_bar.setVisible(True)
     current_value = 0
 
-    for column in range(maths.grid_col()):
-        for row in range(max(min(
-                image.height() // cell_height + 1, maths.grid_row()), 1)):
-            # Calculate the origin of the cell
-            cell_origin = maths.cell_origin((column, row))
+    # Retrieve the grid dimensions once for the whole loop
+    grid_col = maths.grid_col()
+    grid_row = maths.grid_row()
+    rows = max(min(image.height() // cell_height + 1, grid_row), 1)
+    limit_x, limit_y = maths.grid_limit()
+
+    # Offset of the loaded cells in the grid
+    offset_col, offset_row = index if index else (0, 0)
 
-            # Crop the image to the cell size
-            crop_image = image.copy(*cell_origin, cell_width, cell_height)
+    # Find the cells with visible pixels in one pass over the whole image
+    valid_cells = utils.valid_cells(image, cell_width, cell_height)
 
+    for column in range(grid_col):
+        for row in range(rows):
             # Display the loop progress inside of the progress bar
             current_value += 1
             progress = current_value / max_value * 100
@@ -418,20 +482,21 @@ def load(app, image=None, history=True, reset=False, index=None):
                 app.progress_bar.setValue(0)
 
             # Skip "empty" image
-            if not utils.has_valid_pixel(crop_image):
+            if (column, row) not in valid_cells:
                 continue
 
+            # Crop the image to the cell size
+            crop_image = image.copy(
+                column * cell_width, row * cell_height, cell_width, cell_height)
+
             # Calculate the grid cell origin
-            cell_index = (column, row)
-            if index:
-                cell_index = (column + index[0], row + index[1])
-            cell_origin = maths.cell_origin(cell_index)
+            cell_index = (column + offset_col, row + offset_row)
+            cell_origin = (
+                cell_index[0] * cell_width, cell_index[1] * cell_height)
 
             # Check if the cell is out of bounds
-            limit = maths.cell_origin(
-                (maths.grid_col() - 1, maths.grid_row() - 1))
-            if any(coord < 0 or coord > limit
-                    for coord, limit, in zip(cell_origin, limit)):
+            if not (0 <= cell_origin[0] <= limit_x
+                    and 0 <= cell_origin[1] <= limit_y):
                 continue
 
             # Create a pixmap
@@ -443,9 +508,9 @@ def load(app, image=None, history=True, reset=False, index=None):
             painter.drawImage(0, 0, crop_image)
             painter.end()
 
-            if cell_index in app.images:
-                app.main_view.scene.removeItem(app.images[cell_index])
-                del app.images[cell_index]
+            previous_item = app.images.pop(cell_index, None)
+            if previous_item is not None:
+                app.main_view.scene.removeItem(previous_item)
 
             # Create a pixmap item and set its position
             pixmap_item = QGraphicsPixmapItem(pixmap)
@@ -491,7 +556,7 @@ def load_folder(app):
 
     # Create a temp if there are images loaded
     if app.images:
-        temp_path = files.create_temp_all(app)
+        temp_path = files.create_temp_all(app, True)
         utils.history(app, "OVERHAUL", None, temp_path)
 
     col, row = 0, maths.max_row(app)
@@ -516,8 +581,9 @@ def load_folder(app):
             app.progress_bar.setVisible(False)
             break
 
-        # Load the image as a QImage
-        image = QImage(image_path)
+        # Load the image as a QImage in the pixmap format
+        image = QImage(image_path).convertToFormat(
+            image_manipulation.IMAGE_FORMAT)
 
         # Display loop progress
         progress = (index + 1) / len(images) * 100
@@ -534,9 +600,11 @@ def load_folder(app):
 
         # Scale the image if it exceed the cell size
         if image.width() > cell_width:
-            image = image.scaled(cell_width, image.height())
+            image = image_manipulation.fast_scale(
+                image, cell_width, image.height())
         if image.height() > cell_height:
-            image = image.scaled(image.width(), cell_height)
+            image = image_manipulation.fast_scale(
+                image, image.width(), cell_height)
 
         # Create a pixmap
         pixmap = QPixmap(cell_width, cell_height)
@@ -582,7 +650,7 @@ def custom_grid(app):
             "WARNING", ["YES", "NO"]
         )
 
-        if response == "&No":
+        if response == QMessageBox.StandardButton.No:
             return
 
         config.config_set("GRID COLUMNS", column)
@@ -590,6 +658,7 @@ def custom_grid(app):
         config.config_set("CELL SIZE", f"{cell_width}x{cell_height}")
         config.config_set("CREATOR", "None")
         config.config_set("TYPE", "Custom")
+        maths.clear_cache()
 
         # Restart the application
         from main import restart
@@ -599,13 +668,13 @@ def custom_grid(app):
 def custom_cell_size(app):
     dialog = TwoInputs(
         title="Custom Cell Size",
-        label_1="Cell Width", value_1="32",
-        label_2="Cell Height", value_2="32")
+        label_1="Cell Width", value_1=32, range_1=(1, 4096),
+        label_2="Cell Height", value_2=32, range_2=(1, 4096))
 
     if dialog.exec() == QDialog.Accepted:
-        # Retrieve the values from the text boxes
-        cell_width = dialog.textbox_1.text()
-        cell_height = dialog.textbox_2.text()
+        # Retrieve the values from the spin boxes
+        cell_width = dialog.spinbox_1.value()
+        cell_height = dialog.spinbox_2.value()
 
         # Show a warning popup to confirm whether to continue without saving.
         utils.config_changes_restart(
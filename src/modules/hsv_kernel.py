@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+"""hsv_kernel.py
+
+Optional compiled version of image_manipulation.adjust_hsv for large images.
+
+The kernel is only available when numba is installed, otherwise
+AVAILABLE is False and the NumPy version should be used instead.
+"""
+import sys
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+AVAILABLE = njit is not None
+
+# Below this number of pixels NumPy is already fast enough
+MIN_PIXELS = 256 * 256
+
+# Index of each hsv component inside of the kernel
+COMPONENTS = {"hue": 0, "saturation": 1, "value": 2}
+
+# Keep the compiled kernel on disk next to the module, except in the frozen
+# build where that folder is temporary or read only
+CACHE_KERNEL = not getattr(sys, "frozen", False)
+
+
+if AVAILABLE:
+    @njit(parallel=True, cache=CACHE_KERNEL)
+    def adjust_hsv(pixels, component, value):
+        """
+        Change one hsv component of every pixel in place.
+
+        Args:
+            - pixels: A (height, width, 4) uint8 array of RGBA pixels.
+            - component: The index of the component in COMPONENTS.
+            - value: The hue or saturation to set, or the amount to add
+                to the value.
+        """
+        height, width = pixels.shape[0], pixels.shape[1]
+
+        for y in prange(height):
+            for x in range(width):
+                # Fully transparent pixels stay empty
+                if pixels[y, x, 3] == 0:
+                    pixels[y, x, 0] = 0
+                    pixels[y, x, 1] = 0
+                    pixels[y, x, 2] = 0
+                    continue
+
+                red = np.float32(pixels[y, x, 0])
+                green = np.float32(pixels[y, x, 1])
+                blue = np.float32(pixels[y, x, 2])
+
+                # Convert the pixel to hsv
+                maximum = max(red, green, blue)
+                delta = maximum - min(red, green, blue)
+
+                hue = np.float32(0)
+                if delta > 0:
+                    if maximum == red:
+                        hue = ((green - blue) / delta) % 6
+                    elif maximum == green:
+                        hue = (blue - red) / delta + 2
+                    else:
+                        hue = (red - green) / delta + 4
+                    hue *= 60
+
+                saturation = np.float32(0)
+                if maximum > 0:
+                    saturation = delta / maximum
+                brightness = maximum
+
+                # Apply the change, gray pixels do not have any hue nor
+                # saturation
+                if component == 0:
+                    hue = np.float32(value % 360)
+                elif component == 1:
+                    if delta > 0:
+                        saturation = np.float32(value / 255)
+                else:
+                    brightness = min(max(brightness + value, 0), 255)
+
+                # Convert the pixel back to rgb
+                chroma = brightness * saturation
+                sector = hue / 60
+                second = chroma * (1 - abs(sector % 2 - 1))
+                sector = int(np.floor(sector)) % 6
+
+                if sector == 0:
+                    red, green, blue = chroma, second, 0
+                elif sector == 1:
+                    red, green, blue = second, chroma, 0
+                elif sector == 2:
+                    red, green, blue = 0, chroma, second
+                elif sector == 3:
+                    red, green, blue = 0, second, chroma
+                elif sector == 4:
+                    red, green, blue = second, 0, chroma
+                else:
+                    red, green, blue = chroma, 0, second
+
+                lowest = brightness - chroma
+                pixels[y, x, 0] = min(max(np.rint(red + lowest), 0), 255)
+                pixels[y, x, 1] = min(max(np.rint(green + lowest), 0), 255)
+                pixels[y, x, 2] = min(max(np.rint(blue + lowest), 0), 255)
@@ -1,16 +1,36 @@
 #!/usr/bin/env python
 """image_manipulation.py"""
-from PySide6.QtCore import Qt, QTimer, QEventLoop
-from PySide6.QtGui import QImage, QPainter, QPixmap, QTransform
+import itertools
+import numpy as np
+from PySide6.QtCore import Qt, QEventLoop
+from PySide6.QtGui import QImage, QPainter, QPixmap
 from PySide6.QtWidgets import QDialog, QGraphicsPixmapItem
 from classes.dialogs import TwoInputs
-from PIL import Image
 from modules import config
 from modules import files
 from modules import grid_manager
+from modules import hsv_kernel
 from modules import maths
 
 
+# Format of the intermediate images, it matches the one used by pixmaps with
+# an alpha channel so drawing them onto cells does not need any conversion
+IMAGE_FORMAT = QImage.Format.Format_ARGB32_Premultiplied
+
+# Size of the zoom preview for each preset type
+ZOOM_SIZES = {"Weapons": (300, 220)}
+
+# Number of scaled previews kept in memory
+ZOOM_CACHE_SIZE = 64
+
+
+# Number of frames of an animation for each preset type, defaults to 3
+ANIMATION_FRAMES = {"States": 8, "Balloons": 8, "Faces": 4}
+
+# Number of frames of an animation for each creator, whatever the type
+CREATOR_ANIMATION_FRAMES = {"Holder": 4}
+
+
 def zoom(app, item, layer=0, reset=True):
     """
     Zoom in on the specified QGraphicsPixmapItem.
@@ -22,21 +42,48 @@ def zoom(app, item, layer=0, reset=True):
     if reset:
         app.zoom_scene.clear()
     if item is not None:
-        # Scale the pixmap to the desired width and height with the best quality
         if not isinstance(item, QPixmap):
             item = item.pixmap()
 
-        image = Image.fromqimage(item.toImage())
+        # Scale the pixmap with a nearest neighbor filter, animations show
+        # the same few frames over and over so the result is kept
+        width, height = ZOOM_SIZES.get(config.config_get("TYPE"), (300, 300))
+        key = (item.cacheKey(), width, height)
+        scaled = app.zoom_cache.get(key)
 
-        if config.config_get("TYPE") == "Weapons":
-            image = image.resize((300, 220), resample=Image.NEAREST)
-        else:
-            image = image.resize((300, 300), resample=Image.NEAREST)
-        item = QGraphicsPixmapItem(QPixmap.fromImage(image.toqimage()))
+        if scaled is None:
+            scaled = fast_scale(item, width, height)
+            app.zoom_cache[key] = scaled
+
+            # Forget the oldest preview once the cache is full
+            if len(app.zoom_cache) > ZOOM_CACHE_SIZE:
+                del app.zoom_cache[next(iter(app.zoom_cache))]
+
+        item = QGraphicsPixmapItem(scaled)
         item.setZValue(layer)
         app.zoom_scene.addItem(item)
 
 
+def fast_scale(image, width, height):
+    """
+    Scale an image to the given size with a nearest neighbor filter.
+
+    Args:
+        - image: The QPixmap or QImage to scale.
+        - width: The width of the scaled image.
+        - height: The height of the scaled image.
+
+    Returns:
+        - The scaled QPixmap or QImage.
+    """
+    return image.scaled(
+        width,
+        height,
+        Qt.AspectRatioMode.IgnoreAspectRatio,
+        Qt.TransformationMode.FastTransformation
+    )
+
+
 def play_animation(app):
     """
     Play a X frames animations.
@@ -44,86 +91,56 @@ def play_animation(app):
     Args:
         - app: The application main window
     """
-    if (not app.main_view.highlight_selected
+    # Nothing to animate without a selected cell, the selection is
+    # [None, None] once it has been cleared
+    if (app.main_view.highlight_selected[1] is None
             and not app.main_view.mass_highlight):
         return
 
     if not app.images:
         return
 
-    if len(app.main_view.mass_highlight) > 1:
-        indexes = []
-        for highlight, index in app.main_view.mass_highlight:
-            indexes.append(index)
+    # Stop any animation still using the timer
+    stop_animation(app)
 
-        app.animation[1] = indexes
+    if len(app.main_view.mass_highlight) > 1:
+        app.animation[1] = tuple(
+            index for highlight, index in app.main_view.mass_highlight)
 
     else:
-        index = app.main_view.highlight_selected[1]
-        group_index = None
-
         creator = config.config_get("CREATOR")
         type_ = config.config_get("TYPE")
 
         if type_ in ["Tileset", "Icons"]:
             return
 
-        # Iterate over the grid
-        for column in range(maths.grid_col()):
-            for row in range(maths.grid_row()):
-                # Calculate the group index based on the column and row values
-                if index == (column, row):
-                    if creator == "None":
-                        if type_ in ["States", "Balloons"]:
-                            group_index = (column // 8, row)
-                        else:
-                            group_index = (column // 3, row)
-                    if creator == "Holder":
-                        group_index = (column // 4, row)
-                    break
-
-        if group_index:
-            if creator == "None":
-                if type_ in ["States", "Balloons"]:
-                    x = group_index[0] * 8
-                    y = group_index[1]
-
-                    app.animation[1] = [
-                        (x, y), (x + 1, y), (x + 2, y),
-                        (x + 3, y), (x + 4, y), (x + 5, y),
-                        (x + 6, y), (x + 7, y)]
-
-                elif type_ == "Faces":
-                    x = group_index[0] * 4
-                    y = group_index[1]
-
-                    app.animation[1] = [
-                        (x, y), (x + 1, y), (x + 2, y), (x + 3, y)]
-
-                else:
-                    x = group_index[0] * 3
-                    y = group_index[1]
-
-                    app.animation[1] = [(x, y), (x + 1, y), (x + 2, y)]
-
-            if creator == "Holder":
-                x = group_index[0] * 4
-                y = group_index[1]
-
-                app.animation[1] = [(x, y), (x + 1, y), (x + 2, y), (x + 3, y)]
-
-    # Initialize the image index
-    image_index = 0
-
-    # Create a timer for the animation loop
-    app.animation[0] = QTimer()
-    app.animation[0].setInterval(140)
+        # Retrieve the number of frames of an animation for the preset
+        if creator in CREATOR_ANIMATION_FRAMES:
+            frames = CREATOR_ANIMATION_FRAMES[creator]
+        elif creator == "None":
+            frames = ANIMATION_FRAMES.get(type_, 3)
+        else:
+            return
+
+        # A single mass highlight leaves no selected cell to animate
+        index = app.main_view.highlight_selected[1]
+        if index is None:
+            return
+
+        # Calculate the first frame of the group the index belongs to
+        column, row = index
+        x = column // frames * frames
+
+        app.animation[1] = tuple((x + frame, row) for frame in range(frames))
+
+    # Loop over the frames endlessly
+    app.animation_frames = itertools.cycle(app.animation[1])
+
+    # Reuse the application timer for the animation loop
+    app.animation[0] = app.animation_timer
 
     def animation_timeout():
-        nonlocal image_index
-        grid_manager.highlight_index(
-            app, app.animation[1][image_index])
-        image_index = (image_index + 1) % len(app.animation[1])
+        grid_manager.highlight_index(app, next(app.animation_frames))
 
     app.animation[0].timeout.connect(animation_timeout)
     app.animation[0].start()
@@ -132,7 +149,9 @@ def play_animation(app):
 def stop_animation(app):
     if app.animation[0]:
         app.animation[0].stop()
+        app.animation[0].timeout.disconnect()
         app.animation = [None, None]
+        app.animation_frames = None
 
 
 def offset(app, direction=None, x=None, y=None):
@@ -153,16 +172,10 @@ def offset(app, direction=None, x=None, y=None):
     index = app.main_view.highlight_selected[1]
 
     # Check if the index exists in the images dictionary
-    if index in app.images:
+    item = app.images.get(index)
+    if item is not None:
         # Get the images as a pixmap
-        image_pixmap = app.images[index].pixmap()
-
-        # Create a new pixmap
-        offset_pixmap = QPixmap(*app.cell_size)
-        offset_pixmap.fill(Qt.GlobalColor.transparent)
-
-        # Create a painter to draw on the pixmap
-        painter = QPainter(offset_pixmap)
+        image_pixmap = item.pixmap()
 
         # Determine the offset values based on the specified direction
         offset_x = offset_y = 0
@@ -180,13 +193,104 @@ def offset(app, direction=None, x=None, y=None):
             if y:
                 offset_y = y
 
-        # Draw the offset pixmap by applying the offset values
-        painter.drawPixmap(offset_x, offset_y, image_pixmap)
-        painter.end()
+        if image_pixmap.size().toTuple() == app.cell_size:
+            # Move the rows of the image directly in memory
+            offset_image = shift_image(
+                image_pixmap.toImage(), offset_x, offset_y)
+        else:
+            # Create a new pixmap
+            offset_image = QPixmap(*app.cell_size)
+            offset_image.fill(Qt.GlobalColor.transparent)
+
+            # Draw the offset pixmap by applying the offset values
+            painter = QPainter(offset_image)
+            painter.drawPixmap(offset_x, offset_y, image_pixmap)
+            painter.end()
+
+            offset_image = offset_image.toImage()
+
+        grid_manager.add_to_grid(app, offset_image, index)
+
+
+def shift_image(image, offset_x, offset_y):
+    """
+    Translate the content of an image, uncovered pixels are left transparent.
+
+    Args:
+        - image: The QImage to translate.
+        - offset_x: The horizontal offset in pixels.
+        - offset_y: The vertical offset in pixels.
+
+    Returns:
+        - QImage: A new image of the same size with the translated content.
+    """
+    image = image.convertToFormat(IMAGE_FORMAT)
+    width, height = image.width(), image.height()
+
+    shifted_image = QImage(width, height, image.format())
+    shifted_image.fill(0)
+
+    # Nothing is left to copy if the offset exceed the image size
+    row_bytes = (width - abs(offset_x)) * 4
+    if row_bytes <= 0 or abs(offset_y) >= height:
+        return shifted_image
+
+    # The source is only read, constBits() keeps it from detaching when its
+    # data is shared with a pixmap, bits() is only used on the new image
+    source = image.constBits()
+    target = shifted_image.bits()
+    source_stride = image.bytesPerLine()
+    target_stride = shifted_image.bytesPerLine()
+
+    # Rows which receive a part of the source image
+    first_row = max(offset_y, 0)
+    last_row = min(height + offset_y, height)
+
+    if offset_x == 0 and source_stride == target_stride:
+        # Rows are contiguous, copy them all at once
+        start = (first_row - offset_y) * source_stride
+        end = (last_row - offset_y) * source_stride
+        target[first_row * target_stride:last_row * target_stride] = (
+            source[start:end])
+        return shifted_image
+
+    source_x = max(-offset_x, 0) * 4
+    target_x = max(offset_x, 0) * 4
+
+    for row in range(first_row, last_row):
+        start = (row - offset_y) * source_stride + source_x
+        target_start = row * target_stride + target_x
+        target[target_start:target_start + row_bytes] = (
+            source[start:start + row_bytes])
+
+    return shifted_image
+
+
+def parse_int(text, minimum=None, maximum=None):
+    """
+    Convert a text input into an integer within the given bounds.
+
+    Args:
+        - text: The text to convert.
+        - minimum: The lowest accepted value, unbounded if None.
+        - maximum: The highest accepted value, unbounded if None.
+
+    Returns:
+        - int: The converted value, or None if the text is not a valid
+            integer or is out of bounds.
+    """
+    try:
+        value = int(text)
+    except ValueError:
+        return None
+
+    if minimum is not None and value < minimum:
+        return None
+
+    if maximum is not None and value > maximum:
+        return None
 
-        # Create a new pixmap item with the offset pixmap
-        pixmap_item = QGraphicsPixmapItem(offset_pixmap)
-        grid_manager.add_to_grid(app, pixmap_item, index)
+    return value
 
 
 def change_offset(app):
@@ -209,27 +313,14 @@ def change_offset(app):
     dialog = TwoInputs(
         title="Offset",
         label_1=f"Offset X (-{cell_width}:{cell_width}):",
-        value_1="0",
+        range_1=(-cell_width, cell_width),
         label_2=f"Offset Y (-{cell_height}:{cell_height}):",
-        value_2="0")
+        range_2=(-cell_height, cell_height))
 
     if dialog.exec() == QDialog.Accepted:
-        # Retrieve values from the text boxes
-        offset_x = dialog.textbox_1.text()
-        offset_y = dialog.textbox_2.text()
-
-        if ((
-            offset_x.startswith("-") and offset_x[1:].isdigit()
-                or offset_x.isdigit()
-        ) and (
-            offset_y.startswith("-") and offset_y[1:].isdigit()
-                or offset_y.isdigit())):
-            offset_x = int(offset_x)
-            offset_y = int(offset_y)
-        else:
-            return
-
-        offset(app=app, x=offset_x, y=offset_y)
+        # The spin boxes already keep the values within the cell size
+        offset(app=app, x=dialog.spinbox_1.value(),
+               y=dialog.spinbox_2.value())
 
 
 def change_hue(app):
@@ -240,12 +331,8 @@ def change_hue(app):
         - app: The application main window
     """
     # Prevent running if there is no selected cell
-    value = app.values["Hue"].text()
-    if not value.isdigit():
-        return
-    value = int(value)
-
-    if value > 359 or value < 0:
+    value = parse_int(app.values["Hue"].text(), 0, 359)
+    if value is None:
         return
 
     if len(app.main_view.mass_highlight) > 0:
@@ -292,12 +379,8 @@ def change_saturation(app):
     Args:
         - app: The application main window
     """
-    value = app.values["Saturation"].text()
-    if not value.isdigit():
-        return
-    value = int(value)
-
-    if value > 255 or value < 0:
+    value = parse_int(app.values["Saturation"].text(), 0, 255)
+    if value is None:
         return
 
     if len(app.main_view.mass_highlight) > 0:
@@ -344,12 +427,8 @@ def change_value(app):
     Args:
         - app: The application main window
     """
-    value = app.values["Value"].text()
-    if not value.isdigit():
-        return
-    value = int(value)
-
-    if value > 255 or value < -255:
+    value = parse_int(app.values["Value"].text(), -255, 255)
+    if value is None:
         return
 
     if len(app.main_view.mass_highlight) > 0:
@@ -389,6 +468,115 @@ def change_value(app):
         value_slider.on_slider_end(app)
 
 
+def qimage_to_array(image):
+    """
+    Copy the pixels of an image into a NumPy array.
+
+    Args:
+        - image: The QImage to read.
+
+    Returns:
+        - numpy.ndarray: A (height, width, 4) uint8 array of RGBA pixels.
+    """
+    image = image.convertToFormat(QImage.Format.Format_RGBA8888)
+    width, height = image.width(), image.height()
+
+    # Rows can be padded, only keep the pixels, constBits() reads the data
+    # without detaching the image
+    array = np.frombuffer(image.constBits(), np.uint8).reshape(
+        height, image.bytesPerLine())
+    return array[:, :width * 4].reshape(height, width, 4).copy()
+
+
+def array_to_qimage(array):
+    """
+    Create an image from a NumPy array of pixels.
+
+    Args:
+        - array: A (height, width, 4) uint8 array of RGBA pixels.
+
+    Returns:
+        - QImage: An image owning a copy of the pixels.
+    """
+    array = np.ascontiguousarray(array, np.uint8)
+    height, width = array.shape[:2]
+
+    image = QImage(
+        array.data, width, height, width * 4, QImage.Format.Format_RGBA8888)
+
+    # Detach the image from the array buffer
+    return image.copy()
+
+
+def adjust_hsv(image, component, value):
+    """
+    Set the hue or saturation, or shift the value of every pixel of an image.
+
+    Args:
+        - image: The QImage to modify.
+        - component: The hsv component to change; can be hue, saturation
+            or value.
+        - value: The hue (0:359) or saturation (0:255) to set, or the
+            amount (-255:255) to add to the value.
+
+    Returns:
+        - QImage: The modified image.
+    """
+    pixels = qimage_to_array(image)
+
+    # Large images are processed by the compiled kernel when available
+    if (hsv_kernel.AVAILABLE
+            and pixels.shape[0] * pixels.shape[1] >= hsv_kernel.MIN_PIXELS):
+        hsv_kernel.adjust_hsv(
+            pixels, hsv_kernel.COMPONENTS[component], value)
+        return array_to_qimage(pixels)
+
+    rgb = pixels[..., :3].astype(np.float32)
+    red, green, blue = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+
+    # Convert the pixels to hsv
+    maximum = rgb.max(axis=-1)
+    delta = maximum - rgb.min(axis=-1)
+    gray = delta == 0
+    safe_delta = np.where(gray, 1, delta)
+
+    hue = np.select(
+        [maximum == red, maximum == green],
+        [((green - blue) / safe_delta) % 6, (blue - red) / safe_delta + 2],
+        (red - green) / safe_delta + 4) * 60
+    saturation = np.where(
+        maximum > 0, delta / np.where(maximum > 0, maximum, 1), 0)
+    brightness = maximum
+
+    # Apply the change, gray pixels do not have any hue nor saturation
+    if component == "hue":
+        hue = np.full_like(hue, value % 360)
+    elif component == "saturation":
+        saturation = np.where(gray, 0, value / 255)
+    elif component == "value":
+        brightness = np.clip(brightness + value, 0, 255)
+
+    # Convert the pixels back to rgb
+    chroma = brightness * saturation
+    sector = hue / 60
+    second = chroma * (1 - np.abs(sector % 2 - 1))
+    zero = np.zeros_like(chroma)
+    sector = np.floor(sector).astype(np.int8) % 6
+
+    conditions = [sector == 0, sector == 1, sector == 2, sector == 3, sector == 4]
+    red = np.select(conditions, [chroma, second, zero, zero, second], chroma)
+    green = np.select(conditions, [second, chroma, chroma, second, zero], zero)
+    blue = np.select(conditions, [zero, zero, second, chroma, chroma], second)
+
+    rgb = np.stack([red, green, blue], axis=-1) + (brightness - chroma)[..., None]
+    pixels[..., :3] = np.clip(np.rint(rgb), 0, 255).astype(np.uint8)
+
+    # Fully transparent pixels stay empty
+    pixels[pixels[..., 3] == 0] = 0
+
+    return array_to_qimage(pixels)
+
+
 def flip_image(app, orientation):
     """
     Flip the image based on the specified orientation.
@@ -412,23 +600,25 @@ def flip_image(app, orientation):
         for highlight, index in app.main_view.mass_highlight:
             images_index.append(index)
 
+    # Mirror over the corresponding axis
+    if orientation == "Vertical":
+        horizontal, vertical = True, False
+    elif orientation == "Horizontal":
+        horizontal, vertical = False, True
+    else:
+        return
+
     # Check if the index exists in the images directory
     for index in images_index:
-        if index in app.images:
-            # Get the image from the cell
-            image = app.images[index].pixmap().toImage()
-
-            # Transform the image
-            transform = QTransform()
-            if orientation == "Vertical":
-                transform.scale(-1, 1)
-            elif orientation == "Horizontal":
-                transform.scale(1, -1)
-            else:
-                return
+        item = app.images.get(index)
+        if item is not None:
+            # Get the image from the cell, toImage() already returns a copy
+            # which is not shared with the pixmap
+            image = item.pixmap().toImage()
 
-            flipped_image = image.transformed(transform)
-            grid_manager.add_to_grid(app, flipped_image, index)
+            # Flip the image in place
+            image.mirror(horizontal, vertical)
+            grid_manager.add_to_grid(app, image, index)
 
 
 def change_color(app, color=None):
@@ -440,12 +630,8 @@ def change_color(app, color=None):
         - color: The color to modify (can be Red, Green or Blue)
     """
     # Prevent running if there is no selected cell
-    value = app.values[color].text()
-    if not value.isdigit():
-        return
-    value = int(value)
-
-    if value > 255 or value < -255:
+    value = parse_int(app.values[color].text(), 0, 255)
+    if value is None:
         return
 
     if len(app.main_view.mass_highlight) > 0:
@@ -497,10 +683,11 @@ def copy(app):
         return
 
     # Check if the cell index exists in the images dict
-    index = app.main_view.highlight_selected[1]
-    if index in app.images:
-        # Store it inside of the app attribute
-        app.copied_image = app.images[index]
+    item = app.images.get(app.main_view.highlight_selected[1])
+    if item is not None:
+        # Store its pixmap inside of the app attribute, pixmaps are implicitly
+        # shared so no copy happens until one of them is modified
+        app.copied_image = item.pixmap()
 
 
 def cut(app):
@@ -533,7 +720,7 @@ def paste(app):
     if app.main_view.highlight_selected[0] and app.copied_image:
         # Get the index of the selected cell
         index = app.main_view.highlight_selected[1]
-        grid_manager.add_to_grid(app, app.copied_image, index)
+        grid_manager.add_to_grid(app, app.copied_image.toImage(), index)
 
 
 def undo(app):
@@ -549,30 +736,41 @@ def undo(app):
     images = app.images
     main_view = app.main_view
 
+    # Bind the helpers used across the branches
+    cell_origin = maths.cell_origin
+    add_to_grid = grid_manager.add_to_grid
+    remove_from_grid = grid_manager.remove_from_grid
+    highlight_index = grid_manager.highlight_index
+    load_temp = files.load_temp
+
     # Check if there is any action to undo
     if not undo:
         return
 
+    # Make sure that temporary files are written before reading them back
+    files.wait_temp_writes()
+
     # Retrieve the last action from the undo list
     last_action = undo.pop()
     type_, index, temp = last_action[:3]
 
     if type_ in ["ADD", "DELETE"]:
         # Calculate the cell origin based on the index
-        cell_origin = maths.cell_origin(index)
+        origin = cell_origin(index)
 
         if type_ == "ADD":
             # Check if there is an item at the current index and removes it
-            item = images[index]
+            item = images.get(index)
             temp_path = None
             if item:
-                temp_path = grid_manager.remove_from_grid(app, index)
+                temp_path = remove_from_grid(app, index)
 
             # Check if there was an image before the action
             if temp:
-                pixmap_item = QGraphicsPixmapItem(QPixmap(temp))
+                pixmap_item = QGraphicsPixmapItem(
+                    QPixmap.fromImage(load_temp(app, temp)))
                 main_view.scene.addItem(pixmap_item)
-                pixmap_item.setPos(*cell_origin)
+                pixmap_item.setPos(*origin)
                 images[index] = pixmap_item
 
             # Append this action into the redo list
@@ -580,13 +778,13 @@ def undo(app):
 
         if type_ == "DELETE":
             # Check if there was an image before the action
-            grid_manager.add_to_grid(app, QImage(temp), index, False)
+            add_to_grid(app, load_temp(app, temp), index, False)
 
             # Append this action into the redo list
             redo.append(("DELETE", index, None, None))
 
         # Create or move the highlight to this cell
-        grid_manager.highlight_index(app, index)
+        highlight_index(app, index)
 
     elif type_ == "MOVE":
         # Retrieve both indexes from the action argument
@@ -601,8 +799,8 @@ def undo(app):
             item_b = images.get(index_b)
 
             # Calculate cell origins based on the indexes
-            origin_a = maths.cell_origin(index_a)
-            origin_b = maths.cell_origin(index_b)
+            origin_a = cell_origin(index_a)
+            origin_b = cell_origin(index_b)
 
             if item_a:
                 item_a.setPos(*origin_b)
@@ -617,28 +815,29 @@ def undo(app):
             images[index_a] = images[index_b]
             del images[index_b]
             item = images[index_a]
-            item.setPos(*maths.cell_origin(index_a))
+            item.setPos(*cell_origin(index_a))
 
             if temp:
-                grid_manager.add_to_grid(app, QImage(temp), index_b, False)
+                add_to_grid(app, load_temp(app, temp), index_b, False)
 
         # Add the action to the redo list
         redo.append(("MOVE", index, None, move_type))
 
         # Create or move the highlight to the index
-        grid_manager.highlight_index(app, index_a)
+        highlight_index(app, index_a)
 
     elif type_ == "OVERHAUL":
         # Create a temp of the full view
         temp_path = files.create_temp_all(app)
 
-        if temp:
-            # Open the image and replace all images
-            grid_manager.load(
-                app, QImage(temp), False, True)
-        else:
-            # Remove all images
-            grid_manager.clear_main_view(app)
+        # Replace every items without reindexing the scene for each of them
+        with grid_manager.batch_scene_changes(app):
+            if temp:
+                # Open the image and replace all images
+                grid_manager.load(app, load_temp(app, temp), False, True)
+            else:
+                # Remove all images
+                grid_manager.clear_main_view(app)
 
         # Add the action to the redo list
         redo.append(("OVERHAUL", None, temp_path))
@@ -655,33 +854,43 @@ def redo(app):
     redo = app.redo
     images = app.images
 
+    # Bind the helpers used across the branches
+    cell_origin = maths.cell_origin
+    add_to_grid = grid_manager.add_to_grid
+    remove_from_grid = grid_manager.remove_from_grid
+    highlight_index = grid_manager.highlight_index
+    load_temp = files.load_temp
+
     # Prevent running if the redo history is empty
     if not redo:
         return
 
+    # Make sure that temporary files are written before reading them back
+    files.wait_temp_writes()
+
     # Retrieve the last action from the redo list
     last_action = redo.pop()
     type_, index, temp = last_action[:3]
 
     if type_ in ["ADD", "DELETE"]:
         if type_ == "ADD":
-            temp_path = grid_manager.remove_from_grid(app, index)
+            temp_path = remove_from_grid(app, index)
 
             # Add back the previous image
-            grid_manager.add_to_grid(app, QImage(temp), index, False)
+            add_to_grid(app, load_temp(app, temp), index, False)
 
             # Add the action back into the undo list
             undo.append(("ADD", index, temp_path, None))
 
         if type_ == "DELETE":
             # Remove the image at the specified index
-            temp_path = grid_manager.remove_from_grid(app, index)
+            temp_path = remove_from_grid(app, index)
 
             # Add the action back into the undo list
             undo.append(("DELETE", index, temp_path, None))
 
         # Create or move the highlight to the current index
-        grid_manager.highlight_index(app, index)
+        highlight_index(app, index)
 
     if type_ == "MOVE":
         # Retrieve indexes from last action index parameters
@@ -692,11 +901,11 @@ def redo(app):
         temp_path = None
 
         if move_type == "SWITCH":
-            item_a = images[index_a]
-            item_b = images[index_b]
+            item_a = images.get(index_a)
+            item_b = images.get(index_b)
 
-            origin_a = maths.cell_origin(index_a)
-            origin_b = maths.cell_origin(index_b)
+            origin_a = cell_origin(index_a)
+            origin_b = cell_origin(index_b)
 
             if item_a:
                 item_a.setPos(*origin_b)
@@ -711,10 +920,10 @@ def redo(app):
 
         elif move_type == "OVERWRITE":
             # If "overwrite", remove the image at index_b
-            temp_path = grid_manager.remove_from_grid(app, index_b)
+            temp_path = remove_from_grid(app, index_b)
 
             item = images[index_a]
-            item.setPos(*maths.cell_origin(index_b))
+            item.setPos(*cell_origin(index_b))
             images[index_b] = item
             del images[index_a]
 
@@ -722,17 +931,18 @@ def redo(app):
             undo.append(("MOVE", index, temp_path, move_type))
 
         # Create or move the highlight to the current index
-        grid_manager.highlight_index(app, index_b)
+        highlight_index(app, index_b)
 
     elif type_ == "OVERHAUL":
         # Create temporary files from the main scene
         temp_path = files.create_temp_all(app)
 
         # Open the previous image again
-        if temp:
-            grid_manager.load(app, QImage(temp), False, True)
-        else:
-            grid_manager.clear_main_view(app)
+        with grid_manager.batch_scene_changes(app):
+            if temp:
+                grid_manager.load(app, load_temp(app, temp), False, True)
+            else:
+                grid_manager.clear_main_view(app)
 
         # Add the action back to the undo list
         undo.append(("OVERHAUL", None, temp_path, None))
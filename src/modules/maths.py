@@ -2,9 +2,19 @@
 """maths.py"""
 
 import re
+from functools import lru_cache
+from operator import itemgetter
 from modules import config
 
+# Format of the cell size in the config file, (int)x(int)
+CELL_SIZE_PATTERN = re.compile(r"(\d+)x(\d+)")
 
+# Key functions retrieving the column and the row of a grid index
+COLUMN = itemgetter(0)
+ROW = itemgetter(1)
+
+
+@lru_cache(maxsize=None)
 def cell_size():
     """
     Get the cell size based on the configuration.
@@ -16,13 +26,14 @@ def cell_size():
     config_size = config.config_get("CELL SIZE")
 
     # Check that the config size is format as (int)x(int)
-    match = re.match(r"(\d+)x(\d+)", config_size)
+    match = CELL_SIZE_PATTERN.match(config_size)
     if match:
         return (int(match.group(1)), int(match.group(2)))
 
     return (32, 32)
 
 
+@lru_cache(maxsize=None)
 def grid_col():
     """
     Get the number of columns from the configuration.
@@ -38,6 +49,7 @@ def grid_col():
     return 16
 
 
+@lru_cache(maxsize=None)
 def grid_row():
     """
     Get the number of rows from the configuration.
@@ -70,6 +82,7 @@ def cell_index(x, y):
     return (x, y)
 
 
+@lru_cache(maxsize=4096)
 def cell_origin(index):
     """
     Get the pixel coordinates of the cell top left corner.
@@ -86,6 +99,31 @@ def cell_origin(index):
     return (x, y)
 
 
+@lru_cache(maxsize=None)
+def grid_limit():
+    """
+    Get the pixel coordinates of the last cell of the grid.
+
+    Returns:
+        - The coordinates in pixel of the bottom right cell top left corner.
+    """
+    return cell_origin((grid_col() - 1, grid_row() - 1))
+
+
+def clear_cache():
+    """
+    Clear the cached results which depend on the grid configuration.
+
+    This needs to be called whenever the cell size or the grid
+    dimensions change in the config file.
+    """
+    cell_size.cache_clear()
+    grid_col.cache_clear()
+    grid_row.cache_clear()
+    cell_origin.cache_clear()
+    grid_limit.cache_clear()
+
+
 def max_col(app):
     """
     Get the column index of the furthest item.
@@ -97,7 +135,7 @@ def max_col(app):
         - Furthest column index.
     """
     if app.images:
-        return max(app.images.keys(), key=lambda x: x[0])[0]
+        return max(app.images, key=COLUMN)[0]
     return -1
 
 
@@ -112,5 +150,5 @@ def max_row(app):
         - Lowest row index.
     """
     if app.images:
-        return max(app.images.keys(), key=lambda x: x[1])[1]
+        return max(app.images, key=ROW)[1]
     return -1
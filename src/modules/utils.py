@@ -1,25 +1,71 @@
 #!/usr/bin/env python
 """utils.py"""
+import html
 import os
 import re
 import sys
-import requests
 import textwrap
+import time
 import traceback
-from github import Github
+import numpy as np
+from functools import lru_cache, partial
 from dotenv import load_dotenv
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QPixmap, qAlpha
+from PySide6.QtCore import (
+    QElapsedTimer, QObject, QRunnable, QThreadPool, Qt, Signal
+)
+from PySide6.QtGui import QImage, QPixmap
 from PySide6.QtWidgets import QColorDialog, QDialog, QMessageBox
 from classes import main_window
 from classes import dialogs
 from modules import config
+from modules import maths
 
 extDataDir = os.getcwd()
 if getattr(sys, 'frozen', False):
     extDataDir = sys._MEIPASS
 load_dotenv(dotenv_path=os.path.join(extDataDir, '.env'))
 
+# Settings of the .env file, they do not change once it is loaded
+VERSION = os.getenv('VERSION')
+GITHUB_RELEASES = os.getenv('GITHUB_RELEASES')
+GITHUB_URL = os.getenv('GITHUB_URL')
+
+# Path of the changelog shown as the releases notes, it sits next to the
+# executable once frozen and at the root of the repository otherwise
+if getattr(sys, 'frozen', False):
+    CHANGELOG_PATH = os.path.join(sys._MEIPASS, "changelog.md")
+else:
+    CHANGELOG_PATH = os.path.abspath(os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "../..", "changelog.md"))
+
+# First two numerical parts of the file names sorted by numerical_sort
+TWO_NUMBERS_PATTERN = re.compile(r"\D*(\d+)\D+(\d+)")
+
+# Number of seconds before a request to GitHub gives up
+REQUEST_TIMEOUT = 5
+
+# Thread pool sending the requests, separate from the global pool which is
+# waited for on exit. The requests are sent one at a time since they share
+# a requests.Session, which is not thread safe
+network_pool = QThreadPool()
+network_pool.setMaxThreadCount(1)
+
+# Signals of the requests still running, kept alive until they are delivered
+pending_requests = set()
+
+# Number of seconds the releases fetched from GitHub are reused for
+RELEASES_CACHE_TIME = 300
+
+# Minimum number of milliseconds between two repaints of the progress bar
+PROGRESS_INTERVAL = 16
+
+# Number of rows scanned at once by has_valid_pixel
+VALID_PIXEL_ROWS = 32
+
+# Results of has_valid_pixel for pixmaps, by pixmap cache key
+VALID_PIXEL_CACHE_SIZE = 4096
+valid_pixel_cache = {}
+
 
 def has_valid_pixel(image):
     """
@@ -32,29 +78,171 @@ def has_valid_pixel(image):
         bool: True if the image has at least one pixel with an alpha
             higher than 25, False otherwise
     """
-    # Convert the image to a QPixmap
-    pixmap = QPixmap(image)
+    if image.isNull():
+        return False
+
+    # Images without an alpha channel are fully opaque, this is known
+    # without reading any pixel
+    if not image.hasAlphaChannel():
+        return True
+
+    # The cache key of a pixmap changes whenever its pixels do, so a pixmap
+    # which is checked again (when saved or removed) is not scanned twice
+    if isinstance(image, QPixmap):
+        key = image.cacheKey()
+        valid = valid_pixel_cache.get(key)
 
-    # Convert the QPixmap to a QImage
-    qimage = pixmap.toImage()
+        if valid is None:
+            valid = has_valid_pixel(image.toImage())
+            valid_pixel_cache[key] = valid
 
-    # Iterate over the pixels and check their alpha values
-    for y in range(qimage.height()):
-        for x in range(qimage.width()):
-            pixel = qimage.pixel(x, y)
-            alpha = qAlpha(pixel)
-            if alpha > 25:
-                return True
+            # Forget the oldest result once the cache is full
+            if len(valid_pixel_cache) > VALID_PIXEL_CACHE_SIZE:
+                del valid_pixel_cache[next(iter(valid_pixel_cache))]
+
+        return valid
+
+    # Keep the converted image alive while its pixels are read
+    alpha, pixels = alpha_plane(image)
+    height = pixels.shape[0]
+
+    # Scan blocks of rows to stop at the first visible one, instead of
+    # reducing the whole image when most cells are filled
+    for row in range(0, height, VALID_PIXEL_ROWS):
+        if (pixels[row:row + VALID_PIXEL_ROWS] > 25).any():
+            return True
 
     return False
 
 
+def valid_cells(image, cell_width, cell_height):
+    """
+    Find every cell of an image which has any pixel with alpha higher than 25.
+
+    Args:
+        - image: The QImage to split into cells.
+        - cell_width: The width of a cell.
+        - cell_height: The height of a cell.
+
+    Returns:
+        set: The (column, row) indexes of the cells with at least one pixel
+            with an alpha higher than 25.
+    """
+    if image.isNull():
+        return set()
+
+    alpha, pixels = alpha_plane(image)
+    height, width = pixels.shape
+
+    # Pad the image with transparent pixels up to whole cells
+    columns = -(-width // cell_width)
+    rows = -(-height // cell_height)
+    visible = np.zeros((rows * cell_height, columns * cell_width), bool)
+    visible[:height, :width] = pixels > 25
+
+    # Reduce every cell in one pass over the image
+    cells = visible.reshape(rows, cell_height, columns, cell_width).any(
+        axis=(1, 3))
+
+    return {(int(column), int(row)) for row, column in zip(*cells.nonzero())}
+
+
+def alpha_plane(image):
+    """
+    Read the alpha channel of an image.
+
+    Args:
+        - image: The QImage to read.
+
+    Returns:
+        - tuple: The converted QImage and a (height, width) uint8 array of
+            its alpha values, the array does not own its data and is only
+            valid as long as the converted image is alive.
+    """
+    # Only keep the alpha channel, one byte per pixel
+    alpha = image.convertToFormat(QImage.Format.Format_Alpha8)
+    width, height = alpha.width(), alpha.height()
+
+    # Rows can be padded, only keep the pixels
+    pixels = np.frombuffer(alpha.constBits(), np.uint8).reshape(
+        height, alpha.bytesPerLine())[:, :width]
+
+    return alpha, pixels
+
+
+def show_progress(app):
+    """
+    Display the progress bar at 0%.
+
+    Args:
+        - app: The application main window.
+
+    Returns:
+        - QElapsedTimer: The timer to pass to update_progress.
+    """
+    app.progress_bar.setValue(0)
+    app.progress_bar.setVisible(True)
+
+    timer = QElapsedTimer()
+    timer.start()
+    return timer
+
+
+def update_progress(app, timer, value, total):
+    """
+    Display the progress of a loop, the progress bar is repainted at most
+    once every PROGRESS_INTERVAL milliseconds.
+
+    Args:
+        - app: The application main window.
+        - timer: The timer returned by show_progress.
+        - value: The number of processed items.
+        - total: The total number of items.
+    """
+    if timer.elapsed() >= PROGRESS_INTERVAL:
+        app.progress_bar.setValue(value * 100 // total)
+        timer.restart()
+
+
+def hide_progress(app):
+    """
+    Remove the progress bar once a loop is over.
+
+    Args:
+        - app: The application main window.
+    """
+    app.progress_bar.setVisible(False)
+    app.progress_bar.setValue(0)
+
+
+# Icons of the popups, by icon type
+POPUP_ICONS = {
+    "WARNING": QMessageBox.Icon.Warning,
+    "QUESTION": QMessageBox.Icon.Question,
+    "ERROR": QMessageBox.Icon.Critical,
+    "INFO": QMessageBox.Icon.Information
+}
+
+# Standard buttons of the popups, by button type
+POPUP_BUTTONS = {
+    "OK": QMessageBox.StandardButton.Ok,
+    "CANCEL": QMessageBox.StandardButton.Cancel,
+    "YES": QMessageBox.StandardButton.Yes,
+    "NO": QMessageBox.StandardButton.No,
+    "SAVE": QMessageBox.StandardButton.Save,
+    "DISCARD": QMessageBox.StandardButton.Discard,
+    "CLOSE": QMessageBox.StandardButton.Close,
+    "RETRY": QMessageBox.StandardButton.Retry,
+    "IGNORE": QMessageBox.StandardButton.Ignore
+}
+
+
 def show_popup(message, icon_type, buttons, title=None):
     """
     Display a popup dialog with a message, icon, and buttons.
 
     This function creates and displays a popup dialog with the specified message, icon,
-    and buttons. It returns the text of the button that was clicked by the user.
+    and buttons. It returns the standard button that was clicked by the user.
 
     Args:
         message (str): The message to display in the popup.
@@ -62,19 +250,13 @@ def show_popup(message, icon_type, buttons, title=None):
         buttons (list): The list of button types to display in the popup.
 
     Returns:
-        str: The text of the button that was clicked by the user.
+        QMessageBox.StandardButton: The button that was clicked by the user,
+            compared by role since the button text depends on the Qt locale.
     """
     popup = QMessageBox()
 
     # Set the icon
-    icon_mapping = {
-        "WARNING": QMessageBox.Icon.Warning,
-        "QUESTION": QMessageBox.Icon.Question,
-        "ERROR": QMessageBox.Icon.Critical,
-        "INFO": QMessageBox.Icon.Information
-    }
-
-    icon = icon_mapping.get(icon_type, QMessageBox.Icon.NoIcon)
+    icon = POPUP_ICONS.get(icon_type, QMessageBox.Icon.NoIcon)
     popup.setIcon(icon)
 
     # Set the window title, message, and buttons
@@ -89,7 +271,7 @@ def show_popup(message, icon_type, buttons, title=None):
     popup.setStandardButtons(get_buttons(buttons))
     popup.exec()
 
-    return popup.clickedButton().text()
+    return popup.standardButton(popup.clickedButton())
 
 
 def get_buttons(buttons: list) -> QMessageBox.StandardButton:
@@ -105,25 +287,13 @@ def get_buttons(buttons: list) -> QMessageBox.StandardButton:
         - QMessageBox.StandardButton: The standard buttons object corresponding to the
             specified button types.
     """
-    button_mapping = {
-        "OK": QMessageBox.StandardButton.Ok,
-        "CANCEL": QMessageBox.StandardButton.Cancel,
-        "YES": QMessageBox.StandardButton.Yes,
-        "NO": QMessageBox.StandardButton.No,
-        "SAVE": QMessageBox.StandardButton.Save,
-        "DISCARD": QMessageBox.StandardButton.Discard,
-        "CLOSE": QMessageBox.StandardButton.Close,
-        "RETRY": QMessageBox.StandardButton.Retry,
-        "IGNORE": QMessageBox.StandardButton.Ignore
-    }
-
     # Initialize the standard buttons with NoButton
     standard_buttons = QMessageBox.StandardButton(
         QMessageBox.StandardButton.NoButton)
 
     # Iterate over the button types and add them to the standard buttons object
     for button in buttons:
-        standard_buttons |= button_mapping.get(
+        standard_buttons |= POPUP_BUTTONS.get(
             button, QMessageBox.StandardButton.NoButton)
 
     return standard_buttons
@@ -151,98 +321,100 @@ def config_changes_restart(app, key, value, creator=None, opt_value=None):
         "WARNING", ["YES", "NO"]
     )
 
-    if response == "&No":
+    if response == QMessageBox.StandardButton.No:
         # Restore previous configuration settings in the menu.
-        for action in app.view_menu.actions():
-            if action.menu():
-                for action in action.menu().actions():
-                    if action.text() == config.config_get(key):
-                        action.setChecked(True)
+        action = app.config_actions.get(key.upper(), {}).get(
+            config.config_get(key))
+        if action:
+            action.setChecked(True)
         return
 
     # Update the configuration settings with the new values
     config.config_set(key, value)
     parallel_config_changes(key, value, creator, opt_value)
+    maths.clear_cache()
 
     # Restart the application
     from main import restart
     restart()
 
 
+# Settings changed along with a type or a tileset sheet, by (key, value)
+PRESET_SETTINGS = {
+    ("Tileset Sheet", "A1-A2"): {"GRID COLUMNS": "16", "GRID ROWS": "12"},
+    ("Tileset Sheet", "A3"): {"GRID COLUMNS": "16", "GRID ROWS": "8"},
+    ("Tileset Sheet", "A4"): {"GRID COLUMNS": "16", "GRID ROWS": "15"},
+    ("Tileset Sheet", "A5"): {"GRID COLUMNS": "8", "GRID ROWS": "16"},
+    ("Tileset Sheet", "B-E"): {"GRID COLUMNS": "16", "GRID ROWS": "16"},
+    ("Type", "Icons"): {
+        "GRID COLUMNS": "16",
+        "GRID ROWS": "10000",
+        "CELL SIZE": "32x32"
+    },
+    ("Type", "Tileset"): {
+        "TILESET SHEET": "A1-A2",
+        "GRID COLUMNS": "16",
+        "GRID ROWS": "12",
+        "CELL SIZE": "48x48"
+    },
+    ("Type", "Faces"): {
+        "GRID COLUMNS": "4",
+        "GRID ROWS": "2",
+        "CELL SIZE": "144x144"
+    },
+    ("Type", "SV Actor"): {
+        "GRID COLUMNS": "9",
+        "GRID ROWS": "6",
+        "CELL SIZE": "64x64"
+    },
+    ("Type", "Sprites"): {
+        "GRID COLUMNS": "12",
+        "GRID ROWS": "8",
+        "CELL SIZE": "48x48"
+    },
+    ("Type", "States"): {
+        "GRID COLUMNS": "8",
+        "GRID ROWS": "10",
+        "CELL SIZE": "96x96"
+    },
+    ("Type", "Weapons"): {
+        "GRID COLUMNS": "6",
+        "GRID ROWS": "6",
+        "CELL SIZE": "96x64"
+    },
+    ("Type", "Balloons"): {
+        "GRID COLUMNS": "8",
+        "GRID ROWS": "16",
+        "CELL SIZE": "48x48"
+    }
+}
+
+# Settings changed along with the Holder presets
+HOLDER_SETTINGS = {
+    "GRID COLUMNS": "4",
+    "GRID ROWS": "14",
+    "TYPE": "Holder SV Actors"
+}
+
+# Cell sizes of the Holder presets
+HOLDER_CELL_SIZES = frozenset(("192x160", "160x160"))
+
+
 def parallel_config_changes(key, value, creator, opt_value):
     if creator is None:
         config.config_set("CREATOR", "None")
 
-        if key == "Tileset Sheet" and value == "A1-A2":
-            config.config_set("GRID COLUMNS", "16")
-            config.config_set("GRID ROWS", "12")
-
-        if key == "Tileset Sheet" and value == "A3":
-            config.config_set("GRID COLUMNS", "16")
-            config.config_set("GRID ROWS", "8")
-
-        if key == "Tileset Sheet" and value == "A4":
-            config.config_set("GRID COLUMNS", "16")
-            config.config_set("GRID ROWS", "15")
-
-        if key == "Tileset Sheet" and value == "A5":
-            config.config_set("GRID COLUMNS", "8")
-            config.config_set("GRID ROWS", "16")
-
-        if key == "Tileset Sheet" and value == "B-E":
-            config.config_set("GRID COLUMNS", "16")
-            config.config_set("GRID ROWS", "16")
-
-        if key == "Type" and value == "Icons":
-            config.config_set("GRID COLUMNS", "16")
-            config.config_set("GRID ROWS", "10000")
-            config.config_set("CELL SIZE", "32x32")
-
-        if key == "Type" and value == "Tileset":
-            config.config_set("TILESET SHEET", "A1-A2")
-            config.config_set("GRID COLUMNS", "16")
-            config.config_set("GRID ROWS", "12")
-            config.config_set("CELL SIZE", "48x48")
-
-        if key == "Type" and value == "Faces":
-            config.config_set("GRID COLUMNS", "4")
-            config.config_set("GRID ROWS", "2")
-            config.config_set("CELL SIZE", "144x144")
-
-        if key == "Type" and value == "SV Actor":
-            config.config_set("GRID COLUMNS", "9")
-            config.config_set("GRID ROWS", "6")
-            config.config_set("CELL SIZE", "64x64")
-
-        if key == "Type" and value == "Sprites":
-            config.config_set("GRID COLUMNS", "12")
-            config.config_set("GRID ROWS", "8")
-            config.config_set("CELL SIZE", "48x48")
-
-        if key == "Type" and value == "States":
-            config.config_set("GRID COLUMNS", "8")
-            config.config_set("GRID ROWS", "10")
-            config.config_set("CELL SIZE", "96x96")
-
-        if key == "Type" and value == "Weapons":
-            config.config_set("GRID COLUMNS", "6")
-            config.config_set("GRID ROWS", "6")
-            config.config_set("CELL SIZE", "96x64")
-
-        if key == "Type" and value == "Balloons":
-            config.config_set("GRID COLUMNS", "8")
-            config.config_set("GRID ROWS", "16")
-            config.config_set("CELL SIZE", "48x48")
+        # Apply the settings which go along with the new value
+        settings = PRESET_SETTINGS.get((key, value), {})
+        for setting, setting_value in settings.items():
+            config.config_set(setting, setting_value)
 
     if creator == "Holder":
-        config.config_set("GRID COLUMNS", "4")
-        config.config_set("GRID ROWS", "14")
-        config.config_set("TYPE", "Holder SV Actors")
+        for setting, setting_value in HOLDER_SETTINGS.items():
+            config.config_set(setting, setting_value)
 
-        if opt_value == "192x160":
-            config.config_set("CELL SIZE", "192x160")
-        if opt_value == "160x160":
-            config.config_set("CELL SIZE", "160x160")
+        if opt_value in HOLDER_CELL_SIZES:
+            config.config_set("CELL SIZE", opt_value)
 
         config.config_set("CREATOR", "Holder")
 
@@ -250,7 +422,7 @@ def parallel_config_changes(key, value, creator, opt_value):
 def about():
     show_popup(f"""
         <h1>RPG Maker - Set Manager</h1>
-        <br>Version : {os.getenv('VERSION')}
+        <br>Version : {VERSION}
         <br>Author  : Costantin Hereiti
         <br>License : <a href="https://www.gnu.org/licenses/lgpl-3.0.en.html">LGPL v3</a>
         <br>Python  : 3.11.3 - 64Bit
@@ -265,6 +437,9 @@ def report_issue():
         title = form.title.text()
         desc = form.desc.toPlainText()
 
+        # Imported on demand, PyGithub takes a noticeable part of the startup
+        from github import Github
+
         try:
             # Github Token won't be shared in source code
             # Github repo won't be shared in source code
@@ -283,101 +458,196 @@ def report_issue():
             """))
 
 
-def compare_versions(current_version):
-    # API endpoint to fetch the releases of a repository
-    url = os.getenv('GITHUB_RELEASES')
+def fetch_json(url):
+    """
+    Send a GET request and parse its JSON response.
 
-    if not url:
-        return
+    Args:
+        - url: The url to send the request to.
 
-    try:
-        # Send a GET request to the API endpoint
-        response = requests.get(url)
-        response.raise_for_status()
+    Returns:
+        - The parsed JSON response.
+    """
+    # Send a GET request, a stalled connection gives up instead of
+    # keeping a thread of the pool forever
+    response = get_session().get(url, timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()
 
-        # Parse the JSON response
-        releases = response.json()
+    # Parse the JSON response
+    return response.json()
 
-        if releases:
-            # Extract the latest release version number
-            latest_version = releases[0]['tag_name']
 
-            # Compare the versions
-            if current_version < latest_version:
-                show_popup(textwrap.dedent("""
-                    A new version is available!
-                    Get it on <a href="https://hereiti.itch.io/rpg-maker-set-manager">itch.io</a> or <a href="https://github.com/Hereiti/RPG-Maker-Set-Manager/releases">github</a>
-                    """), "INFO", ["OK"])  # noqa: E501
+@lru_cache(maxsize=1)
+def get_session():
+    """
+    Retrieve the session shared by the requests to GitHub, only used from
+    the single thread of the network pool.
 
-    except requests.exceptions.RequestException as e:
-        print(f"Error occurred while fetching releases: {e}")
+    requests is only imported once the first request is sent, from the
+    network pool, instead of slowing down the startup.
 
+    Returns:
+        - requests.Session: The session reusing the connection to GitHub.
+    """
+    import requests
 
-def check_update(current_version):
-    # API endpoint to fetch the releases of a repository
-    url = os.getenv('GITHUB_RELEASES')
+    return requests.Session()
+
+
+@lru_cache(maxsize=1)
+def fetch_releases(time_slot):
+    """
+    Retrieve the releases of the repository from the GitHub API.
+
+    The result is kept for the whole time slot, so checking for updates
+    again shortly after the startup check does not send another request.
+
+    Args:
+        - time_slot: The index of the RELEASES_CACHE_TIME long period the
+            releases are fetched for.
+
+    Returns:
+        - The list of releases, newest first.
+    """
+    return fetch_json(GITHUB_RELEASES)
+
+
+def send_request(fetch, callback, description):
+    """
+    Fetch data from the network pool and hand it over to the main thread.
+
+    Args:
+        - fetch: The function sending the request and returning its result.
+        - callback: The function called with the result from the main thread.
+        - description: What is fetched, for the error message.
+    """
+    signals = RequestSignals()
+    pending_requests.add(signals)
+
+    def finished(result):
+        pending_requests.discard(signals)
+        if result is not None:
+            callback(result)
 
-    if not url:
+    # Queue the signal back to the main thread, popups cannot be shown from
+    # the thread sending the request
+    signals.finished.connect(finished)
+    network_pool.start(Request(fetch, signals, description))
+
+
+class RequestSignals(QObject):
+    """Signals of a request sent from the network pool."""
+    finished = Signal(object)
+
+
+class Request(QRunnable):
+    """Send a request from the network pool to keep the interface responsive."""
+
+    def __init__(self, fetch, signals, description):
+        """
+        Initialize the runnable
+
+        Args:
+            - fetch: The function sending the request and returning its result.
+            - signals: The RequestSignals emitted with the result.
+            - description: What is fetched, for the error message.
+        """
+        super().__init__()
+        self.fetch = fetch
+        self.signals = signals
+        self.description = description
+
+    def run(self):
+        result = None
+
+        # Any error, including a malformed response, is reported the same
+        # way and the signal is always emitted so the request is released
+        try:
+            result = self.fetch()
+
+        except Exception as e:
+            print(f"Error occurred while fetching {self.description}: {e}")
+
+        finally:
+            self.signals.finished.emit(result)
+
+
+def compare_versions(current_version, show_up_to_date=False):
+    """
+    Tell the user when a newer version has been released.
+
+    Args:
+        - current_version: The tag of the running version.
+        - show_up_to_date: Also tell the user when there is no newer version.
+    """
+    # API endpoint to fetch the releases of a repository
+    if not GITHUB_RELEASES:
         return
 
-    try:
-        # Send a GET request to the API endpoint
-        response = requests.get(url)
-        response.raise_for_status()
+    send_request(
+        partial(fetch_releases, int(time.time() // RELEASES_CACHE_TIME)),
+        partial(show_latest_version, current_version, show_up_to_date),
+        "releases")
 
-        # Parse the JSON response
-        releases = response.json()
 
-        if releases:
-            # Extract the latest release version number
-            latest_version = releases[0]['tag_name']
+def show_latest_version(current_version, show_up_to_date, releases):
+    """
+    Compare the running version with the latest release.
 
-            if current_version >= latest_version:
-                show_popup(textwrap.dedent("""
-                    Your application is up to date.
-                    """), "INFO", ["OK"])
+    Args:
+        - current_version: The tag of the running version.
+        - show_up_to_date: Also tell the user when there is no newer version.
+        - releases: The list of releases, newest first.
+    """
+    if releases:
+        # Extract the latest release version number
+        latest_version = releases[0]['tag_name']
 
-            # Compare the versions
-            if current_version < latest_version:
-                show_popup(textwrap.dedent("""
-                    A new version is available!
-                    Get it on <a href="https://hereiti.itch.io/rpg-maker-set-manager">itch.io</a> or <a href="https://github.com/Hereiti/RPG-Maker-Set-Manager/releases">github</a>
-                    """), "INFO", ["OK"])  # noqa: E501
+        if show_up_to_date and current_version >= latest_version:
+            show_popup(textwrap.dedent("""
+                Your application is up to date.
+                """), "INFO", ["OK"])
 
-    except requests.exceptions.RequestException as e:
-        print(f"Error occurred while fetching releases: {e}")
+        # Compare the versions
+        if current_version < latest_version:
+            show_popup(textwrap.dedent("""
+                A new version is available!
+                Get it on <a href="https://hereiti.itch.io/rpg-maker-set-manager">itch.io</a> or <a href="https://github.com/Hereiti/RPG-Maker-Set-Manager/releases">github</a>
+                """), "INFO", ["OK"])  # noqa: E501
 
 
-def contributors():
-    url = os.getenv('GITHUB_URL')
+def check_update(current_version):
+    """
+    Tell the user whether a newer version has been released.
 
-    try:
-        response = requests.get(url + "/blob/master/contributors.md")
-        response.raise_for_status()
+    Args:
+        - current_version: The tag of the running version.
+    """
+    compare_versions(current_version, True)
 
-        # Parse the JSON response
-        content = response.json()
-        show_popup(
-            content["payload"]["blob"]["richText"], "INFO", ["OK"], "Contributor(s)")
 
-    except requests.exceptions.RequestException as e:
-        print(f"Error occurred while fetching contributors: {e}")
+def contributors():
+    send_request(
+        partial(fetch_json, GITHUB_URL + "/blob/master/contributors.md"),
+        lambda content: show_popup(
+            content["payload"]["blob"]["richText"], "INFO", ["OK"],
+            "Contributor(s)"),
+        "contributors")
 
 
 def supporters():
-    url = os.getenv('GITHUB_URL')
+    send_request(
+        partial(fetch_json, GITHUB_URL + "/blob/master/supporters.md"),
+        lambda content: show_popup(
+            content["payload"]["blob"]["richText"], "INFO", ["OK"],
+            "Supporters"),
+        "supporters")
 
-    try:
-        response = requests.get(url + "/blob/master/supporters.md")
-        response.raise_for_status()
 
-        # Parse the JSON response
-        content = response.json()
-        show_popup(
-            content["payload"]["blob"]["richText"], "INFO", ["OK"], "Supporters")
-
-    except requests.exceptions.RequestException as e:
-        print(f"Error occurred while fetching supporters: {e}")
+# Style sheets of the views once a background color is picked, the color
+# itself is painted by the background brush of the views
+ZOOM_VIEW_STYLE = "border: 1px solid red;"
+MAIN_VIEW_STYLE = "QGraphicsView { border: 1px solid red; }"
 
 
 def images_background(app):
@@ -391,16 +661,21 @@ def images_background(app):
     color = QColorDialog.getColor()
 
     if color.isValid():
-        # Set backgrounds color
-        app.zoom_view.setStyleSheet(
-            f"background-color: {color.name()}; border: 1px solid red;"
-        )
+        # Skip picking the same color again, a view without a background
+        # brush reports black as its color
+        brush = app.main_view.backgroundBrush()
+        if brush.style() != Qt.NoBrush and brush.color() == color:
+            return
+
+        # Set the border style sheets only once, applying a style sheet
+        # parses it and polishes the views all over again
+        if not app.main_view.styleSheet():
+            app.zoom_view.setStyleSheet(ZOOM_VIEW_STYLE)
+            app.main_view.setStyleSheet(MAIN_VIEW_STYLE)
 
-        app.main_view.setStyleSheet((
-            f"QGraphicsView {{"
-            f"background-color: {color.name()};"
-            f"border: 1px solid red; }}"
-        ))
+        # Set backgrounds color
+        app.zoom_view.setBackgroundBrush(color)
+        app.main_view.setBackgroundBrush(color)
 
 
 def history(app, action_type, index, temp=None, move_type=None):
@@ -422,28 +697,27 @@ def history(app, action_type, index, temp=None, move_type=None):
 def numerical_sort(string):
     """Key function for sorting strings with two numbers.
 
-    This function extracts two numerical parts from a string and combines them into a
-    single integer. It is intended to be used as the key function in sorting operations
+    This function extracts two numerical parts from a string and pairs them into a
+    tuple. It is intended to be used as the key function in sorting operations
     to achieve sorting based on two numbers.
 
     Args:
         _string (str): The input string.
 
     Returns:
-        int: The combined numerical value of the two parts, or a default value if no
+        tuple: The two numerical parts, or a default value sorted last if no
             numerical parts are found.
     """
-    # Extract numerical parts from the string
-    matches = re.findall(r'\d+', string)
-    if len(matches) >= 2:
-        number1 = int(matches[0])
-        number2 = int(matches[1])
-        # Adjust the multiplier as per your requirements
-        combined_number = (number1 * 100) + number2
-        return combined_number
+    # Extract the first two numerical parts from the string, the match
+    # stops as soon as the second one is found
+    match = TWO_NUMBERS_PATTERN.match(string)
+    if match:
+        # Compare the numbers as a pair, combining them into a single number
+        # would sort 1_100 after 2_0
+        return (int(match.group(1)), int(match.group(2)))
 
     # Return a default value that can be compared
-    return sys.maxsize
+    return (sys.maxsize, sys.maxsize)
 
 
 def get_key_from_value(dictionary, value):
@@ -461,9 +735,12 @@ def get_key_from_value(dictionary, value):
 
 
 def exception_handler(exception_type, exception_value, exception_traceback):
-    error = traceback.format_exception(
+    # Escape the traceback lines as they are built, "<module>" and the like
+    # would otherwise be read as tags by the rich text popup
+    error = traceback.TracebackException(
         exception_type, exception_value, exception_traceback)
-    formatted_error = "<br>".join(error)
+    formatted_error = "".join(
+        html.escape(line).replace("\n", "<br>") for line in error.format())
     show_popup(f"""
         <h2>Uncaught Exception:</h2>
         <h3>You might need to restart the application.</h3>
@@ -472,17 +749,6 @@ def exception_handler(exception_type, exception_value, exception_traceback):
 
 
 def show_releases_notes(app):
-    # Retrieve the image which will be used as an icon for the button
-    if getattr(sys, 'frozen', False):
-        parent_folder = sys._MEIPASS
-    else:
-        current_path = os.path.dirname(os.path.abspath(__file__))
-        parent_folder = os.path.abspath(
-            os.path.join(current_path, "../.."))
-
-    changelog_path = os.path.join(
-        parent_folder, "changelog.md")
-
     app.release_notes = main_window.MarkdownViewer(
-        "Releases Notes", changelog_path)
+        "Releases Notes", CHANGELOG_PATH)
     app.release_notes.show()